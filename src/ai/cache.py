@@ -0,0 +1,206 @@
+"""
+On-disk response cache for the AI client.
+Avoids paying latency and token cost twice for identical prompts.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default cache location: <project root>/.llm_cache
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / ".llm_cache"
+
+
+class LLMCache:
+    """
+    Simple file-per-key cache for LLM responses.
+
+    Each entry is stored as a small JSON file named by its key (expected to
+    be a hex digest), holding the cached value and an optional expiry time.
+    """
+
+    def __init__(self, cache_dir=None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache files (default: '.llm_cache'
+                       in the project root)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(exist_ok=True)
+
+    def _path_for(self, key: str) -> Path:
+        """Return the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key (hex digest of the request)
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+
+        # Drop expired entries
+        expires = entry.get("expires")
+        if expires is not None and time.time() > expires:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        return entry.get("value")
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key (hex digest of the request)
+            value: Value to store
+            ttl: Time-to-live in seconds (None means no expiry)
+        """
+        entry = {
+            "value": value,
+            "expires": time.time() + ttl if ttl is not None else None
+        }
+        try:
+            with open(self._path_for(key), 'w') as f:
+                json.dump(entry, f)
+        except IOError:
+            logger.warning("Could not write cache entry %s", key)
+
+    def clear(self):
+        """Remove all cached entries."""
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+class SemanticCache:
+    """
+    In-memory response cache keyed by embedding similarity.
+
+    Unlike LLMCache, which only hits on byte-identical requests, this cache
+    also serves paraphrased repeats ("how much for materials?" vs "what do
+    the materials cost?"). Entries are looked up by cosine similarity of
+    L2-normalized embeddings against a single (N, D) matrix, so a lookup is
+    one BLAS matrix-vector product.
+    """
+
+    def __init__(self, ai_client, model: str = "text-embedding-3-small",
+                 threshold: float = 0.92, max_entries: int = 512):
+        """
+        Initialize the cache.
+
+        Args:
+            ai_client: AIClient used to compute embeddings
+            model: Embedding model name
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum cached responses (oldest evicted first)
+        """
+        self.ai_client = ai_client
+        self.model = model
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # Row i of _embeddings is the normalized embedding for _responses[i]
+        self._embeddings: Optional[np.ndarray] = None
+        self._responses = []
+        # Embedding from the most recent miss, reused by set() so each user
+        # turn pays for at most one embedding request
+        self._pending = None
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Compute the L2-normalized embedding of a text, or None on failure."""
+        if not self.ai_client.is_available():
+            return None
+        # Runs on the client's persistent loop; asyncio.run would close the
+        # loop the shared HTTP connection pool is bound to
+        embedding = self.ai_client.run(self.ai_client.embed(text, model=self.model))
+        if embedding is None:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def get(self, text: str) -> Optional[str]:
+        """
+        Look up the cached response for a semantically similar text.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Cached response or None if no entry is similar enough
+        """
+        embedding = self._embed(text)
+        if embedding is None:
+            return None
+        self._pending = (text, embedding)
+
+        if self._embeddings is None:
+            return None
+
+        similarities = self._embeddings @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            logger.info("Semantic cache hit (similarity %.3f)", similarities[best])
+            return self._responses[best]
+        return None
+
+    def set(self, text: str, response: str):
+        """
+        Store a response, reusing the embedding computed by the last get().
+
+        Args:
+            text: Query text the response answers
+            response: Response to cache
+        """
+        if self._pending is not None and self._pending[0] == text:
+            embedding = self._pending[1]
+        else:
+            embedding = self._embed(text)
+        if embedding is None:
+            return
+
+        row = embedding[np.newaxis, :]
+        if self._embeddings is None:
+            self._embeddings = row
+        else:
+            self._embeddings = np.vstack([self._embeddings, row])
+        self._responses.append(response)
+
+        # Evict oldest entries beyond the size bound
+        if len(self._responses) > self.max_entries:
+            self._embeddings = self._embeddings[1:]
+            del self._responses[0]
+
+    def clear(self):
+        """Drop all cached entries and any pending embedding."""
+        self._embeddings = None
+        self._responses = []
+        self._pending = None
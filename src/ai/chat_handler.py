@@ -2,61 +2,277 @@
 Handler for managing chat conversations with the AI.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional
-from .client import AIClient
-from .config import PRICING_ADVISOR_PROMPT
+from collections import deque
+from typing import Callable, List, Dict, Optional
+from .client import AIClient, get_default_client
+from .config import PRICING_ADVISOR_PROMPT, PRICING_FUNCTION_SCHEMA
 from .models import PricingRecommendation
 
 logger = logging.getLogger(__name__)
 
+# Tool offered on every chat turn so the model can emit the structured
+# recommendation as soon as it has enough information, saving the separate
+# recommendation round-trip
+PRICING_TOOLS = [{"type": "function", "function": PRICING_FUNCTION_SCHEMA}]
+
 class ChatHandler:
     """
     Handler for managing chat conversations with the AI.
     Tracks conversation history and provides methods for interacting with the AI.
     """
-    
+
     def __init__(self, ai_client: Optional[AIClient] = None):
         """
         Initialize the chat handler.
-        
+
         Args:
             ai_client: AIClient instance or None to create a new one
         """
-        self.ai_client = ai_client or AIClient()
+        self.ai_client = ai_client or get_default_client()
         self.conversation_history = []
+        # Recommendation captured from a tool call mid-conversation (if any)
+        self.pending_recommendation = None
+
+        # Windowing policy: once the history exceeds either bound, the oldest
+        # turns are compacted into a single summary message so per-turn token
+        # cost stays flat instead of growing quadratically over the session
+        self.max_turns = 20
+        self.summarize_threshold_tokens = 4000
+        # Recent messages kept verbatim when compacting (preserves context
+        # and keeps the tail of the prompt stable)
+        self.keep_recent_messages = 6
+
         self._initialize_conversation()
-        
+
     def _initialize_conversation(self):
         """Initialize the conversation with the system prompt."""
-        self.conversation_history = [
-            {"role": "system", "content": PRICING_ADVISOR_PROMPT}
-        ]
+        # Deque gives O(1) append/evict for windowing; the maxlen is a hard
+        # safety bound well above the compaction trigger, so messages are
+        # summarized before they could ever be silently evicted
+        self.conversation_history = deque(
+            [{"role": "system", "content": PRICING_ADVISOR_PROMPT}],
+            maxlen=self.max_turns * 2 + 1
+        )
+        # Incrementally maintained text form of the conversation, so building
+        # a summary doesn't re-format the full history every time
+        self._summary_parts = [f"System: {PRICING_ADVISOR_PROMPT}"]
+        self.pending_recommendation = None
     
-    def send_message(self, user_message: str) -> Optional[str]:
+    def send_message(self, user_message: str,
+                     on_token: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """
         Send a message to the AI and get a response.
-        
+
         Args:
             user_message: Message from the user
-            
+            on_token: Optional callback invoked with each response fragment
+                      as it arrives; when given, the response is streamed so
+                      the UI can render it incrementally
+
         Returns:
             Response from the AI or None if the request fails
         """
+        # A new user turn may change the facts a previously captured
+        # recommendation was based on, so drop it; both paths below
+        # re-capture one if the model emits a fresh tool call
+        self.pending_recommendation = None
+
         # Add user message to history
         self.conversation_history.append({"role": "user", "content": user_message})
-        
-        # Get response from AI
-        response = self.ai_client.chat_completion(self.conversation_history)
-        
+        self._summary_parts.append(f"User: {user_message}")
+
+        if on_token is not None:
+            return self._send_message_streaming(on_token)
+
+        # Get response from AI (the client is async; run it to completion on
+        # the client's persistent loop so callers on worker threads keep a
+        # simple synchronous interface).
+        # The pricing tool is offered on every turn so the model can emit the
+        # structured recommendation inline instead of needing a second call.
+        message = self.ai_client.run(self.ai_client.chat_completion(
+            list(self.conversation_history), tools=PRICING_TOOLS))
+
+        if message is None:
+            logger.warning("No response from AI")
+            return None
+
+        # If the model called the pricing tool, capture the recommendation so
+        # get_recommendations can return it without another API round-trip
+        tool_calls = getattr(message, "tool_calls", None)
+        if tool_calls:
+            recommendation = self.ai_client.parse_recommendation(
+                tool_calls[0].function.arguments)
+            if recommendation:
+                self.pending_recommendation = recommendation
+                logger.info("Captured pricing recommendation from tool call")
+
+        response = message.content
+        if not response and self.pending_recommendation:
+            # Tool-call-only turn: give the user something to act on
+            response = ("I have enough information to recommend pricing parameters. "
+                        "Click 'Get Recommendations' to review and apply them.")
+
         if response:
             # Add AI response to history
             self.conversation_history.append({"role": "assistant", "content": response})
+            self._summary_parts.append(f"Assistant: {response}")
+            self._maybe_compact_history()
             return response
         else:
             logger.warning("No response from AI")
             return None
-    
+
+    def _send_message_streaming(self, on_token: Callable[[str], None]) -> Optional[str]:
+        """
+        Stream the next assistant response, invoking on_token per fragment.
+
+        The pricing tool is offered here too: tool-call deltas can't be
+        rendered as text, so the client accumulates them on the side and the
+        assembled recommendation is captured once the stream ends - the UI's
+        streaming turns save the second round-trip just like non-streaming
+        ones.
+
+        Args:
+            on_token: Callback invoked with each response fragment
+
+        Returns:
+            The full response text or None if the request fails
+        """
+        tool_calls = []
+
+        async def _collect():
+            parts = []
+            async for token in self.ai_client.chat_completion_stream(
+                    list(self.conversation_history),
+                    tools=PRICING_TOOLS, tool_calls_out=tool_calls):
+                parts.append(token)
+                on_token(token)
+            return "".join(parts)
+
+        response = self.ai_client.run(_collect())
+
+        # Same capture as the non-streaming path: a tool call mid-chat lets
+        # get_recommendations answer without another API round-trip
+        if tool_calls:
+            recommendation = self.ai_client.parse_recommendation(tool_calls[0])
+            if recommendation:
+                self.pending_recommendation = recommendation
+                logger.info("Captured pricing recommendation from streamed tool call")
+
+        if not response and self.pending_recommendation:
+            # Tool-call-only turn: nothing was streamed, so surface the
+            # pointer text through the same token callback
+            response = ("I have enough information to recommend pricing parameters. "
+                        "Click 'Get Recommendations' to review and apply them.")
+            on_token(response)
+
+        if response:
+            self.conversation_history.append({"role": "assistant", "content": response})
+            self._summary_parts.append(f"Assistant: {response}")
+            self._maybe_compact_history()
+            return response
+        else:
+            logger.warning("No response from AI")
+            return None
+
+    def record_exchange(self, user_message: str, response: str):
+        """
+        Record a user/assistant exchange without calling the API.
+
+        Used when the response came from a local cache, so the conversation
+        history stays consistent for later turns and recommendation requests.
+
+        Args:
+            user_message: Message from the user
+            response: Assistant response served from cache
+        """
+        # Same invalidation as send_message: the new turn may change the
+        # facts behind a previously captured recommendation
+        self.pending_recommendation = None
+        self.conversation_history.append({"role": "user", "content": user_message})
+        self._summary_parts.append(f"User: {user_message}")
+        self.conversation_history.append({"role": "assistant", "content": response})
+        self._summary_parts.append(f"Assistant: {response}")
+        self._maybe_compact_history()
+
+    def _count_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """
+        Estimate the token count of a message list.
+
+        Uses tiktoken when installed; otherwise falls back to the usual
+        ~4 characters/token heuristic, which is plenty accurate for a
+        windowing threshold.
+
+        Args:
+            messages: List of message dictionaries
+
+        Returns:
+            Approximate number of tokens
+        """
+        try:
+            import tiktoken
+            enc = tiktoken.encoding_for_model(self.ai_client.model_name)
+            return sum(len(enc.encode(m["content"])) for m in messages)
+        except Exception:
+            return sum(len(m["content"]) for m in messages) // 4
+
+    def _summarize(self, messages: List[Dict[str, str]]) -> str:
+        """
+        Summarize a slice of the conversation into a short paragraph.
+
+        Args:
+            messages: Messages to summarize
+
+        Returns:
+            Summary text (a plain transcript truncation if the AI call fails)
+        """
+        transcript = "\n".join(
+            f"{m['role'].capitalize()}: {m['content']}" for m in messages)
+        summary = self.ai_client.run(self.ai_client.chat_completion(
+            [
+                {"role": "system", "content":
+                 "Summarize the following pricing conversation in at most "
+                 "200 tokens, keeping every concrete fact about the product, "
+                 "materials, costs, time, and market."},
+                {"role": "user", "content": transcript}
+            ],
+            temperature=0.0,
+            max_tokens=200
+        ))
+        if summary:
+            return summary
+        # AI unavailable: fall back to a raw truncated transcript
+        return transcript[:800]
+
+    def _maybe_compact_history(self):
+        """
+        Compact old turns into a summary message when the history gets large.
+
+        The original system prompt stays first and the most recent turns stay
+        verbatim, so the prompt prefix remains cache-friendly; only the middle
+        of the conversation is folded into one summary message.
+        """
+        over_turns = len(self.conversation_history) > self.max_turns
+        if not over_turns and self._count_tokens(
+                self.conversation_history) <= self.summarize_threshold_tokens:
+            return
+
+        history = list(self.conversation_history)
+        old_messages = history[1:-self.keep_recent_messages]
+        if not old_messages:
+            return
+
+        logger.info("Compacting %d old messages into a summary", len(old_messages))
+        summary = self._summarize(old_messages)
+        self.conversation_history = deque(
+            [history[0],
+             {"role": "system", "content": f"Prior conversation summary: {summary}"}]
+            + history[-self.keep_recent_messages:],
+            maxlen=self.conversation_history.maxlen
+        )
+
     def get_recommendations(self) -> Optional[PricingRecommendation]:
         """
         Get pricing recommendations based on the conversation history.
@@ -64,35 +280,86 @@ class ChatHandler:
         Returns:
             PricingRecommendation object or None if the request fails
         """
+        # Short-circuit: the model may have already emitted the recommendation
+        # via a tool call during the chat
+        if self.pending_recommendation:
+            logger.info("Returning recommendation captured during conversation")
+            return self.pending_recommendation
+
         # Check if we have enough conversation history
         if len(self.conversation_history) < 3:
             logger.warning("Not enough conversation history to generate recommendations")
             return None
             
-        logger.info(f"Generating recommendations based on {len(self.conversation_history)} messages")
-        
-        # Create a summary of the conversation for the recommendation request
-        conversation_summary = "\n".join([
-            f"{msg['role'].capitalize()}: {msg['content']}" 
-            for msg in self.conversation_history
-        ])
-        
-        logger.debug(f"Conversation summary: {conversation_summary[:500]}...")
-        
+        logger.info("Generating recommendations based on %d messages", len(self.conversation_history))
+
         try:
-            recommendations = self.ai_client.get_pricing_recommendation(conversation_summary)
+            # Send the conversation history as-is so the request shares its
+            # prompt prefix with the chat turns (prompt-cache friendly)
+            recommendations = self.ai_client.run(
+                self.ai_client.get_pricing_recommendation(
+                    list(self.conversation_history)))
             
             if recommendations:
-                logger.info(f"Successfully generated recommendations: {recommendations}")
+                logger.info("Successfully generated recommendations: %s", recommendations)
                 return recommendations
             else:
                 logger.error("Failed to generate recommendations - no data returned")
                 return None
                 
         except Exception as e:
-            logger.error(f"Error generating recommendations: {str(e)}")
+            logger.error("Error generating recommendations: %s", e)
             return None
     
+    def get_recommendations_batch(
+        self,
+        conversations: List[List[Dict[str, str]]]
+    ) -> List[Optional[PricingRecommendation]]:
+        """
+        Get pricing recommendations for several conversations at once.
+
+        The requests run concurrently on the async client (bounded by its
+        max_concurrency), so N sessions cost roughly one network round-trip
+        instead of N. Intended for bulk flows - evaluations, benchmarks,
+        multiple sessions - not the interactive chat, which keeps using
+        get_recommendations.
+
+        Args:
+            conversations: One message list per session
+
+        Returns:
+            One PricingRecommendation per conversation in order, with None
+            for sessions whose request failed
+        """
+        async def _gather():
+            return await asyncio.gather(
+                *[self.ai_client.get_pricing_recommendation(conversation)
+                  for conversation in conversations],
+                return_exceptions=True
+            )
+
+        try:
+            results = self.ai_client.run(_gather())
+        except Exception as e:
+            logger.error("Error generating batch recommendations: %s", e)
+            return [None] * len(conversations)
+
+        return [result if isinstance(result, PricingRecommendation) else None
+                for result in results]
+
+    def get_conversation_summary(self) -> str:
+        """
+        Get the conversation as a single text summary.
+
+        Built from the incrementally maintained parts list, so no per-message
+        re-formatting happens here. Used for offline/bulk flows (e.g. feeding
+        AIClient.submit_pricing_batch) and debugging.
+
+        Returns:
+            Newline-joined transcript of the conversation
+        """
+        return "\n".join(self._summary_parts)
+
     def reset_conversation(self):
         """Reset the conversation history."""
         self._initialize_conversation()
@@ -104,4 +371,4 @@ class ChatHandler:
         Returns:
             List of message dictionaries
         """
-        return self.conversation_history 
\ No newline at end of file
+        return list(self.conversation_history) 
\ No newline at end of file
@@ -2,57 +2,119 @@
 Client for interacting with the OpenAI API.
 """
 
+import asyncio
+import hashlib
 import logging
 import json
-import os
-from openai import OpenAI
+import threading
 from typing import List, Optional, Dict
-from .config import OPENAI_API_KEY, MODEL_NAME
+from tenacity import (AsyncRetrying, retry_if_exception_type,
+                      stop_after_attempt, wait_random_exponential)
+try:
+    # Optional: C-implemented JSON codec, 2-10x faster than the stdlib on
+    # the structured-output and batch-JSONL paths
+    import orjson
+except ImportError:
+    orjson = None
+
+from .cache import LLMCache
+from .config import (get_api_key, MODEL_NAME, PRICING_FUNCTION_SCHEMA,
+                     PRICING_RECOMMENDATION_PROMPT)
 from .models import PricingRecommendation
-from dotenv import load_dotenv
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+# Shared client instance (created on first use by get_default_client)
+_default_client = None
+
+
+def get_default_client():
+    """
+    Get the shared AIClient instance, creating it on first use.
+
+    Using one client per process means one .env parse and one HTTP
+    connection pool, so TCP/TLS connections are reused across all handlers
+    instead of re-established per ChatHandler.
+
+    Returns:
+        The shared AIClient
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = AIClient()
+    return _default_client
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 class AIClient:
     """
     Client for interacting with the OpenAI API.
     Handles API requests, error handling, and retries.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None,
+                 max_concurrency: int = 8):
         """
         Initialize the AI client.
-        
+
         Args:
             api_key: OpenAI API key (defaults to value from config)
             model_name: Model name to use (defaults to value from config)
+            max_concurrency: Maximum number of in-flight API requests for batch calls
         """
-        # Load API key from environment if not provided
+        # Load API key from environment if not provided (the .env file is
+        # parsed once per process, on first use)
         if api_key is None:
-            # Try to load from .env file in project root
-            dotenv_path = os.path.join(os.path.dirname(os.path.dirname(
-                os.path.dirname(os.path.abspath(__file__)))), '.env')
-            if os.path.exists(dotenv_path):
-                load_dotenv(dotenv_path)
-            
-            # Get API key from environment
-            api_key = os.getenv("OPENAI_API_KEY")
-            
+            api_key = get_api_key()
+
             if not api_key:
                 logger.warning("No OpenAI API key found. AI features will not be available.")
         
         self.api_key = api_key
         self.model_name = model_name or MODEL_NAME
-        
-        # Initialize OpenAI client
+
+        # Bound the number of concurrent requests in batch helpers. The
+        # semaphore is created lazily inside a coroutine (see
+        # _get_semaphore) so it binds to the persistent event loop rather
+        # than whichever loop happens to exist at construction time
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+
+        # Persistent background event loop for sync callers (see run()),
+        # started on first use
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+        # On-disk response cache for deterministic requests
+        self.cache = LLMCache()
+        self.stats = {"hits": 0, "misses": 0}
+
+        # Initialize the async OpenAI client (shares one HTTP connection pool
+        # across all concurrent requests)
         if self.api_key:
             try:
-                self.client = OpenAI(api_key=self.api_key)
-                logger.info(f"OpenAI client initialized with model: {self.model_name}")
+                # Deferred import: openai (plus httpx/pydantic) costs hundreds
+                # of milliseconds and would otherwise delay UI startup
+                from openai import AsyncOpenAI
+                self.client = AsyncOpenAI(api_key=self.api_key)
+                logger.info("OpenAI client initialized with model: %s", self.model_name)
             except Exception as e:
-                logger.error(f"Error initializing OpenAI client: {str(e)}")
+                logger.error("Error initializing OpenAI client: %s", e)
                 self.client = None
         else:
             self.client = None
@@ -60,158 +122,489 @@ class AIClient:
     def is_available(self) -> bool:
         """Check if the OpenAI client is available for use."""
         return self.client is not None and self.api_key is not None
-    
-    def chat_completion(
-        self, 
-        messages: List[Dict[str, str]], 
+
+    def _ensure_loop(self):
+        """Start the shared background event loop thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever,
+                                 name="ai-loop", daemon=True).start()
+        return self._loop
+
+    def run(self, coro):
+        """
+        Run a coroutine on the client's persistent event loop and wait.
+
+        Sync callers must use this instead of asyncio.run: asyncio.run
+        creates and closes a fresh loop per call, but the AsyncOpenAI
+        connection pool and the concurrency semaphore bind to the loop they
+        first run on. With per-call loops, a pooled keep-alive connection
+        from a closed loop fails the next request with "Event loop is
+        closed", and a contended semaphore acquire raises "bound to a
+        different event loop" for every later call.
+
+        Args:
+            coro: Coroutine to execute
+
+        Returns:
+            The coroutine's result (exceptions propagate)
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def _get_semaphore(self):
+        """Return the shared concurrency semaphore, creating it on first use.
+
+        Only called from coroutines already running on the persistent loop,
+        so the semaphore binds to that loop.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _create_with_retry(self, **kwargs):
+        """
+        Call chat.completions.create, retrying transient failures.
+
+        Rate limits, timeouts and connection errors are retried with
+        exponential backoff plus jitter (up to 6 attempts, 1-30 s waits) so
+        bursts of concurrent requests degrade gracefully instead of failing
+        on the first 429. Other errors propagate immediately.
+        """
+        from openai import APIConnectionError, APITimeoutError, RateLimitError
+
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(
+                (RateLimitError, APITimeoutError, APIConnectionError)),
+            wait=wait_random_exponential(min=1, max=30),
+            stop=stop_after_attempt(6),
+            reraise=True
+        ):
+            with attempt:
+                return await self.client.chat.completions.create(**kwargs)
+
+    def _cache_key(self, payload: Dict) -> str:
+        """Compute a deterministic cache key for a request payload."""
+        serialized = json.dumps(payload, sort_keys=True).encode()
+        return hashlib.sha256(serialized).hexdigest()
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
         temperature: float = 0.7,
-        max_tokens: int = 500
-    ) -> Optional[str]:
+        max_tokens: int = 300,
+        cache: bool = False,
+        tools: Optional[List[Dict]] = None
+    ):
         """
         Send a request to the chat completions API and return the response.
-        
+
+        Deterministic requests (temperature 0, or cache=True) are served from
+        the on-disk cache when possible, skipping the API round-trip.
+
         Args:
             messages: List of message objects with role and content
             temperature: Sampling temperature (0.0-2.0)
             max_tokens: Maximum tokens to generate
-            
+            cache: Force caching even for non-zero temperature
+            tools: Optional function-calling tools to offer the model
+
         Returns:
-            Response content or None if the request fails
+            Response content (str) or None if the request fails; when tools
+            are provided, the full response message so callers can inspect
+            tool_calls
         """
         if not self.is_available():
             logger.warning("AI client not available. Skipping chat completion request.")
             return None
-        
+
+        # Caching only applies to plain text responses
+        use_cache = tools is None and (cache or temperature == 0)
+        key = None
+        if use_cache:
+            key = self._cache_key({
+                "model": self.model_name,
+                "messages": messages,
+                "temperature": temperature
+            })
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return cached
+            self.stats["misses"] += 1
+
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            return response.choices[0].message.content
+            extra = {}
+            if tools is not None:
+                extra = {"tools": tools, "tool_choice": "auto"}
+            async with self._get_semaphore():
+                response = await self._create_with_retry(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **extra
+                )
+            message = response.choices[0].message
+            if tools is not None:
+                return message
+            if use_cache and message.content is not None:
+                self.cache.set(key, message.content)
+            return message.content
         except Exception as e:
-            logger.error(f"Error in chat completion request: {str(e)}")
+            logger.error("Error in chat completion request: %s", e)
             return None
-    
-    def get_pricing_recommendation(
-        self, 
-        conversation_summary: str
+
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 300,
+        tools: Optional[List[Dict]] = None,
+        tool_calls_out: Optional[List[str]] = None
+    ):
+        """
+        Send a chat completion request and yield tokens as they arrive.
+
+        Streaming makes perceived latency bounded by time-to-first-token
+        (~300 ms) instead of full-response time (seconds), so the UI can
+        render the reply incrementally.
+
+        Args:
+            messages: List of message objects with role and content
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens to generate
+            tools: Optional function-calling tools to offer the model
+            tool_calls_out: Optional list that receives the assembled
+                            argument JSON of each tool call once the stream
+                            ends (tool calls arrive as fragments, so they
+                            can't be yielded like text)
+
+        Yields:
+            Response text fragments in order
+        """
+        if not self.is_available():
+            logger.warning("AI client not available. Skipping chat completion request.")
+            return
+
+        try:
+            extra = {}
+            if tools is not None:
+                extra = {"tools": tools, "tool_choice": "auto"}
+            async with self._get_semaphore():
+                stream = await self._create_with_retry(
+                    model=self.model_name,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    **extra
+                )
+                # Tool-call arguments stream as fragments keyed by index;
+                # accumulate them alongside the text deltas
+                pending_calls = {}
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+                    for call in (delta.tool_calls or []):
+                        if call.function and call.function.arguments:
+                            pending_calls.setdefault(call.index, []).append(
+                                call.function.arguments)
+                    if delta.content:
+                        yield delta.content
+                if tool_calls_out is not None:
+                    for index in sorted(pending_calls):
+                        tool_calls_out.append("".join(pending_calls[index]))
+        except Exception as e:
+            logger.error("Error in streaming chat completion request: %s", e)
+
+    async def embed(
+        self,
+        text: str,
+        model: str = "text-embedding-3-small"
+    ) -> Optional[List[float]]:
+        """
+        Compute the embedding of a text.
+
+        Args:
+            text: Text to embed
+            model: Embedding model name
+
+        Returns:
+            Embedding vector or None if the request fails
+        """
+        if not self.is_available():
+            logger.warning("AI client not available. Skipping embedding request.")
+            return None
+
+        try:
+            async with self._get_semaphore():
+                response = await self.client.embeddings.create(model=model, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            logger.error("Error in embedding request: %s", e)
+            return None
+
+    async def chat_completion_many(
+        self,
+        message_lists: List[List[Dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: int = 300
+    ) -> List[Optional[str]]:
+        """
+        Send several chat completion requests concurrently.
+
+        Requests run in parallel (bounded by max_concurrency) so total wall
+        time is roughly one round-trip instead of one per request.
+
+        Args:
+            message_lists: One list of message objects per request
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens to generate per request
+
+        Returns:
+            One result per request, in order; failed requests yield their exception
+        """
+        return await asyncio.gather(
+            *[self.chat_completion(messages, temperature, max_tokens)
+              for messages in message_lists],
+            return_exceptions=True
+        )
+
+    def _pricing_request_body(self, messages: List[Dict[str, str]]) -> Dict:
+        """
+        Build the chat completions payload for a pricing recommendation request.
+
+        Shared by the interactive path (get_pricing_recommendation) and the
+        Batch API path (submit_pricing_batch) so both stay in sync. The JSON
+        instruction is appended as a trailing user message so the leading
+        messages stay byte-identical to the chat turns and benefit from
+        OpenAI's automatic prompt caching.
+
+        Args:
+            messages: Conversation messages to base the recommendation on
+
+        Returns:
+            Dictionary suitable as the body of a /v1/chat/completions request
+        """
+        return {
+            "model": self.model_name,
+            "messages": messages + [
+                {"role": "user", "content": PRICING_RECOMMENDATION_PROMPT}
+            ],
+            # json_schema mode makes OpenAI enforce the model schema
+            # server-side, so malformed responses can't reach the parser
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": PRICING_FUNCTION_SCHEMA["name"],
+                    "schema": PRICING_FUNCTION_SCHEMA["parameters"],
+                    "strict": True
+                }
+            },
+            "temperature": 0.5,
+            # The schema output realistically fits in ~150 tokens; a tight
+            # cap cuts generation tail-latency with no accuracy cost
+            "max_tokens": 200
+        }
+
+    def parse_recommendation(self, content: str) -> Optional[PricingRecommendation]:
+        """
+        Parse a JSON response body into a PricingRecommendation.
+
+        Args:
+            content: JSON string returned by the model
+
+        Returns:
+            PricingRecommendation object or None if parsing fails
+        """
+        try:
+            data = _json_loads(content)
+
+            # Create the PricingRecommendation object with default selling_price of 0
+            recommendation_data = {
+                "material_cost": data["material_cost"],
+                "hours_worked": data["hours_worked"],
+                "labor_rate": data["labor_rate"],
+                "uniqueness": data["uniqueness"],
+                "demand": data["demand"],
+                "explanation": data["explanation"]
+            }
+
+            # Only add selling_price if it's in the response and non-zero
+            if "selling_price" in data and data["selling_price"] > 0:
+                recommendation_data["selling_price"] = data["selling_price"]
+
+            return PricingRecommendation(**recommendation_data)
+
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.error("Error parsing response: %s, content: %s", e, content)
+            return None
+
+    async def get_pricing_recommendation(
+        self,
+        messages: List[Dict[str, str]],
+        cache: bool = False
     ) -> Optional[PricingRecommendation]:
         """
         Get structured pricing recommendations from the conversation.
         Uses a JSON format and OpenAI's function calling capability.
-        
+
         Args:
-            conversation_summary: Summary of the conversation with the user
-            
+            messages: Conversation messages (same list used for chat turns,
+                      so the cached prompt prefix is reused)
+            cache: Serve repeated requests for the same conversation from the cache
+
         Returns:
             PricingRecommendation object or None if the request fails
         """
         if not self.is_available():
             logger.warning("AI client not available. Skipping pricing recommendation request.")
             return None
-        
+
+        key = None
+        if cache:
+            key = self._cache_key(self._pricing_request_body(messages))
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return self.parse_recommendation(cached)
+            self.stats["misses"] += 1
+
         try:
-            # Set up the function call for structured output
-            function_schema = {
-                "name": "pricing_recommendation",
-                "description": "Generate pricing parameters for a handmade product",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "material_cost": {
-                            "type": "number",
-                            "description": "Total cost of materials in dollars"
-                        },
-                        "hours_worked": {
-                            "type": "number",
-                            "description": "Number of hours spent creating the product"
-                        },
-                        "labor_rate": {
-                            "type": "number",
-                            "description": "Suggested hourly labor rate in dollars"
-                        },
-                        "uniqueness": {
-                            "type": "number",
-                            "description": "Rating of product uniqueness on scale of 1-10"
-                        },
-                        "demand": {
-                            "type": "number",
-                            "description": "Rating of market demand on scale of 1-10"
-                        },
-                        "selling_price": {
-                            "type": "number",
-                            "description": "Optional recommended selling price in dollars (0 means calculate automatically)"
-                        },
-                        "explanation": {
-                            "type": "string",
-                            "description": "Explanation for the recommendations"
-                        }
-                    },
-                    "required": ["material_cost", "hours_worked", "labor_rate", "uniqueness", "demand", "explanation"]
-                }
-            }
-            
             # Make the request with the JSON response format
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": 
-                     """You are a pricing expert for handmade goods. Based on the conversation summary 
-                     provided, recommend appropriate pricing parameters. Be realistic and consider 
-                     the artisan's experience level, time investment, and material costs.
-                     
-                     You MUST respond with a valid JSON object containing the following fields:
-                     - material_cost: Total cost of materials in dollars (number)
-                     - hours_worked: Number of hours spent creating the product (number)
-                     - labor_rate: Suggested hourly labor rate in dollars (number)
-                     - uniqueness: Rating of product uniqueness on scale of 1-10 (number)
-                     - demand: Rating of market demand on scale of 1-10 (number)
-                     - selling_price: Optional recommended selling price in dollars (0 for automatic calculation) (number)
-                     - explanation: Explanation for the recommendations (string)
-                     
-                     In most cases, set selling_price to 0 to let the system calculate the price automatically based on costs and market factors. Only provide a specific selling_price if there's a clear market price point that should be targeted regardless of costs.
-                     
-                     Ensure all number values are reasonable and appropriate.
-                     """
-                    },
-                    {"role": "user", "content": f"Based on this conversation, recommend pricing parameters:\n\n{conversation_summary}"}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.5,
-                max_tokens=1000
-            )
-            
+            async with self._get_semaphore():
+                response = await self._create_with_retry(
+                    **self._pricing_request_body(messages)
+                )
+
             # Parse the JSON response
+            if response.choices[0].finish_reason == "length":
+                logger.warning("Recommendation output hit the max_tokens cap "
+                               "and may be truncated")
             content = response.choices[0].message.content
-            logger.info(f"Received response: {content}")
-            
-            try:
-                data = json.loads(content)
-                
-                # Create the PricingRecommendation object with default selling_price of 0
-                recommendation_data = {
-                    "material_cost": data["material_cost"],
-                    "hours_worked": data["hours_worked"],
-                    "labor_rate": data["labor_rate"],
-                    "uniqueness": data["uniqueness"],
-                    "demand": data["demand"],
-                    "explanation": data["explanation"]
-                }
-                
-                # Only add selling_price if it's in the response and non-zero
-                if "selling_price" in data and data["selling_price"] > 0:
-                    recommendation_data["selling_price"] = data["selling_price"]
-                
-                recommendation = PricingRecommendation(**recommendation_data)
-                
-                return recommendation
-                
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.error(f"Error parsing response: {str(e)}, content: {content}")
-                return None
-            
+            logger.info("Received response: %.500s", content)
+
+            if cache and content is not None:
+                self.cache.set(key, content)
+
+            return self.parse_recommendation(content)
+
+        except Exception as e:
+            logger.error("Error in pricing recommendation request: %s", e)
+            return None
+
+    async def submit_pricing_batch(self, summaries: List[str]) -> Optional[str]:
+        """
+        Submit a bulk pricing recommendation job via the OpenAI Batch API.
+
+        Batch jobs run at 50% of the cost of interactive requests and draw
+        from a separate rate-limit pool, so use this for offline workloads
+        (nightly recomputes, benchmarking) rather than interactive chats.
+
+        Args:
+            summaries: One conversation summary per artisan/product
+
+        Returns:
+            Batch job ID or None if submission fails
+        """
+        if not self.is_available():
+            logger.warning("AI client not available. Skipping batch submission.")
+            return None
+
+        try:
+            # Build the JSONL input: one chat completions request per summary
+            jsonl_lines = [
+                _json_dumps_bytes({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._pricing_request_body([
+                        {"role": "user", "content": f"Conversation summary:\n\n{summary}"}
+                    ])
+                })
+                for i, summary in enumerate(summaries)
+            ]
+            input_file = await self.client.files.create(
+                file=("pricing_batch.jsonl", b"\n".join(jsonl_lines)),
+                purpose="batch"
+            )
+
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info("Submitted pricing batch %s with %d requests", batch.id, len(summaries))
+            return batch.id
+
+        except Exception as e:
+            logger.error("Error submitting pricing batch: %s", e)
+            return None
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0
+    ) -> Optional[List[Optional[PricingRecommendation]]]:
+        """
+        Poll a batch job until it finishes and parse its results.
+
+        Args:
+            batch_id: ID returned by submit_pricing_batch
+            poll_interval: Seconds to sleep between status checks
+
+        Returns:
+            Recommendations ordered by custom_id (None for requests that
+            failed to parse), or None if the batch itself fails
+        """
+        if not self.is_available():
+            logger.warning("AI client not available. Skipping batch retrieval.")
+            return None
+
+        try:
+            while True:
+                batch = await self.client.batches.retrieve(batch_id)
+                if batch.status == "completed":
+                    break
+                if batch.status in ("failed", "expired", "cancelled"):
+                    logger.error("Batch %s ended with status: %s", batch_id, batch.status)
+                    return None
+                await asyncio.sleep(poll_interval)
+
+            # Download the output JSONL and parse each line back into a
+            # recommendation, restoring submission order via custom_id
+            output = await self.client.files.content(batch.output_file_id)
+            results = {}
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = _json_loads(line)
+                # Failed requests come back with "response": null and an
+                # "error" object; skip them so the custom_id stays absent
+                # and resolves to None below, instead of a TypeError here
+                # discarding the whole batch
+                response = entry.get("response") or {}
+                body = response.get("body")
+                if not body:
+                    logger.warning("Batch request %s failed: %s",
+                                   entry.get("custom_id"), entry.get("error"))
+                    continue
+                content = body["choices"][0]["message"]["content"]
+                results[int(entry["custom_id"])] = self.parse_recommendation(content)
+
+            # Failed requests are absent from the output file, so size the
+            # result list from the batch's submitted request count - using
+            # len(results) would both truncate the list and misalign every
+            # entry after the first failure
+            counts = getattr(batch, "request_counts", None)
+            if counts is not None and counts.total:
+                total = counts.total
+            else:
+                total = max(results) + 1 if results else 0
+            return [results.get(i) for i in range(total)]
+
         except Exception as e:
-            logger.error(f"Error in pricing recommendation request: {str(e)}")
-            return None 
\ No newline at end of file
+            logger.error("Error retrieving pricing batch: %s", e)
+            return None
\ No newline at end of file
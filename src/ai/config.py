@@ -4,18 +4,31 @@ Contains settings for the OpenAI API and prompts.
 """
 
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 from pathlib import Path
 
-# Try to load environment variables from .env file
-dotenv_path = Path(__file__).parent.parent.parent / ".env"
-if dotenv_path.exists():
-    load_dotenv(dotenv_path)
-
 # OpenAI API settings
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 MODEL_NAME = "gpt-4o-mini"  # Using the 4o mini model as specified
 
+
+@lru_cache(maxsize=1)
+def get_api_key():
+    """
+    Get the OpenAI API key, loading the .env file on first use.
+
+    The dotenv parse happens lazily (not at import time) and only once per
+    process, no matter how many clients are constructed.
+
+    Returns:
+        API key string or None if not configured
+    """
+    dotenv_path = Path(__file__).parent.parent.parent / ".env"
+    if dotenv_path.exists():
+        # Deferred import: dotenv is only needed when a .env file exists
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path)
+    return os.getenv("OPENAI_API_KEY")
+
 # System prompts
 PRICING_ADVISOR_PROMPT = """
 You are an expert pricing assistant for handmade goods. Your goal is to help artisans 
@@ -34,6 +47,64 @@ pricing recommendations. If they have a target profit percentage in mind, explai
 our system now focuses on costs and selling prices directly, showing the resulting profit.
 """
 
+def _build_pricing_function_schema():
+    """
+    Build the pricing function schema from the Pydantic model.
+
+    Deriving the schema from PricingRecommendation (instead of maintaining a
+    parallel hand-written dict) keeps the two from drifting apart, and the
+    dict is built once at import rather than per request.
+    """
+    from .models import PricingRecommendation
+
+    parameters = PricingRecommendation.model_json_schema()
+    # Strict mode rejects schemas containing unsupported keywords with a
+    # 400, and pydantic emits several: "default" (on selling_price),
+    # "minimum"/"maximum" (from the ge/le field constraints) and cosmetic
+    # "title" annotations. Strip them; the prompt still states the ranges
+    parameters.pop("title", None)
+    for prop in parameters["properties"].values():
+        for keyword in ("default", "title", "minimum", "maximum",
+                        "exclusiveMinimum", "exclusiveMaximum"):
+            prop.pop(keyword, None)
+    # Strict mode also requires a closed schema with every property present;
+    # selling_price simply comes back as 0 when not applicable
+    parameters["additionalProperties"] = False
+    parameters["required"] = list(parameters["properties"].keys())
+
+    return {
+        "name": "pricing_recommendation",
+        "description": "Generate pricing parameters for a handmade product",
+        "parameters": parameters
+    }
+
+
+# Function schema the model can call mid-conversation once it has gathered
+# enough information, instead of waiting for a separate recommendation request
+PRICING_FUNCTION_SCHEMA = _build_pricing_function_schema()
+
+# Trailing instruction appended after the conversation when requesting the
+# structured recommendation. Keeping it at the end (rather than swapping in a
+# new system prompt) leaves the conversation prefix byte-identical across
+# turns, so OpenAI's automatic prompt caching can reuse it.
+PRICING_RECOMMENDATION_PROMPT = """Based on the conversation so far, recommend appropriate pricing parameters.
+Be realistic and consider the artisan's experience level, time investment,
+and material costs.
+
+You MUST respond with a valid JSON object containing the following fields:
+- material_cost: Total cost of materials in dollars (number)
+- hours_worked: Number of hours spent creating the product (number)
+- labor_rate: Suggested hourly labor rate in dollars (number)
+- uniqueness: Rating of product uniqueness on scale of 1-10 (number)
+- demand: Rating of market demand on scale of 1-10 (number)
+- selling_price: Optional recommended selling price in dollars (0 for automatic calculation) (number)
+- explanation: Explanation for the recommendations (string)
+
+In most cases, set selling_price to 0 to let the system calculate the price automatically based on costs and market factors. Only provide a specific selling_price if there's a clear market price point that should be targeted regardless of costs.
+
+Ensure all number values are reasonable and appropriate.
+"""
+
 # Default values (fallback if AI is not available)
 DEFAULT_PRICING_PARAMETERS = {
     "material_cost": 10.0,
@@ -3,6 +3,142 @@ Core pricing logic for the Handmade Goods Pricing Assistant
 Handles all price calculations and formulas
 """
 
+import numpy as np
+from dataclasses import dataclass, fields
+
+try:
+    # Optional: JIT-compile the scalar hot path when numba is installed
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _calc_core(material_cost, hours_worked, labor_rate, uniqueness, demand,
+               selling_price, uniqueness_weight, demand_weight,
+               economy_modifier, premium_modifier, suggested_price_multiplier):
+    """
+    Pure-numeric core of the price calculation
+
+    Kept as a free function of plain floats so it can be JIT-compiled with
+    numba when available; selling_price <= 0 means "calculate automatically".
+
+    Returns a 12-tuple:
+        (labor_cost, base_price, uniqueness_adjustment, demand_adjustment,
+         factor_adjustment, adjusted_price, profit_amount,
+         profit_margin_percentage, markup_percentage, final_price,
+         economy_price, premium_price)
+    """
+    labor_cost = hours_worked * labor_rate
+    base_price = material_cost + labor_cost
+
+    uniqueness_factor = (uniqueness - 5) * uniqueness_weight
+    demand_factor = (demand - 5) * demand_weight
+    uniqueness_adjustment = base_price * uniqueness_factor
+    demand_adjustment = base_price * demand_factor
+    factor_adjustment = base_price * (uniqueness_factor + demand_factor)
+
+    adjusted_price = base_price + factor_adjustment
+
+    if selling_price > 0:
+        final_price = selling_price
+    else:
+        final_price = adjusted_price * suggested_price_multiplier
+
+    profit_amount = final_price - adjusted_price
+
+    if final_price > 0:
+        profit_margin_percentage = (profit_amount / final_price) * 100
+    else:
+        profit_margin_percentage = 0.0
+
+    if adjusted_price > 0:
+        markup_percentage = (profit_amount / adjusted_price) * 100
+    else:
+        markup_percentage = 0.0
+
+    economy_price = final_price * economy_modifier
+    premium_price = final_price * premium_modifier
+
+    return (labor_cost, base_price, uniqueness_adjustment, demand_adjustment,
+            factor_adjustment, adjusted_price, round(profit_amount, 2),
+            round(profit_margin_percentage, 2), round(markup_percentage, 2),
+            round(final_price, 2), round(economy_price, 2),
+            round(premium_price, 2))
+
+
+if njit is not None:
+    # cache=True persists the compiled code across runs; fastmath licenses
+    # FMA/reassociation (fine here, values are rounded to cents anyway)
+    _calc_core = njit(cache=True, fastmath=True)(_calc_core)
+
+
+# Element-wise builtin round() for the batch path. np.round scales by 100
+# and rints, which can flip half-cent values the other way from round()
+# (e.g. 67.235 -> 67.24 vs 67.23), breaking scalar/batch parity
+_round2 = np.frompyfunc(lambda value: round(value, 2), 1, 1)
+
+
+def _round_cents(values):
+    """Round an array to cents exactly like the scalar round(x, 2)"""
+    return _round2(values).astype(float)
+
+
+@dataclass(slots=True, frozen=True)
+class PricingResult:
+    """
+    Calculated prices and breakdowns for one product
+
+    Slots keep per-result memory low and attribute access fast for batch
+    callers; to_dict() is available where key-based access is preferred.
+    """
+    material_cost: float
+    labor_cost: float
+    base_price: float
+    uniqueness_adjustment: float
+    demand_adjustment: float
+    factor_adjustment: float
+    adjusted_price: float  # This is the total cost
+    profit_amount: float
+    profit_margin_percentage: float
+    markup_percentage: float
+    final_price: float
+    economy_price: float
+    premium_price: float
+    selling_price: float
+
+    def to_dict(self):
+        """Return the result as a plain dictionary"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True, frozen=True)
+class PricingResults:
+    """
+    Calculated prices and breakdowns for a batch of products
+
+    Structure-of-arrays counterpart to PricingResult: each field holds one
+    NumPy array with a value per product.
+    """
+    material_cost: np.ndarray
+    labor_cost: np.ndarray
+    base_price: np.ndarray
+    uniqueness_adjustment: np.ndarray
+    demand_adjustment: np.ndarray
+    factor_adjustment: np.ndarray
+    adjusted_price: np.ndarray  # This is the total cost
+    profit_amount: np.ndarray
+    profit_margin_percentage: np.ndarray
+    markup_percentage: np.ndarray
+    final_price: np.ndarray
+    economy_price: np.ndarray
+    premium_price: np.ndarray
+    selling_price: np.ndarray
+
+    def to_dict(self):
+        """Return the results as a dictionary of arrays"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
 class PricingCalculator:
     """Calculator that determines optimal pricing for handmade goods"""
     
@@ -32,70 +168,126 @@ class PricingCalculator:
             selling_price: Optional - user's set selling price (if they already have one)
         
         Returns:
-            Dictionary containing the calculated prices and breakdowns
+            PricingResult containing the calculated prices and breakdowns
         """
+        # Run the numeric core (JIT-compiled when numba is available)
+        (labor_cost, base_price, uniqueness_adjustment, demand_adjustment,
+         factor_adjustment, adjusted_price, profit_amount,
+         profit_margin_percentage, markup_percentage, final_price,
+         economy_price, premium_price) = _calc_core(
+            float(material_cost), float(hours_worked), float(labor_rate),
+            float(uniqueness), float(demand),
+            float(selling_price) if selling_price is not None else 0.0,
+            self.uniqueness_weight, self.demand_weight,
+            self.economy_modifier, self.premium_modifier,
+            self.suggested_price_multiplier
+        )
+
+        # Return comprehensive results
+        return PricingResult(
+            material_cost=material_cost,
+            labor_cost=labor_cost,
+            base_price=base_price,
+            uniqueness_adjustment=uniqueness_adjustment,
+            demand_adjustment=demand_adjustment,
+            factor_adjustment=factor_adjustment,
+            adjusted_price=adjusted_price,
+            profit_amount=profit_amount,
+            profit_margin_percentage=profit_margin_percentage,
+            markup_percentage=markup_percentage,
+            final_price=final_price,
+            economy_price=economy_price,
+            premium_price=premium_price,
+            selling_price=selling_price if selling_price is not None else 0
+        )
+    
+    def calculate_prices_batch(self, material_cost, hours_worked, labor_rate,
+                               uniqueness, demand, selling_price=None):
+        """
+        Calculate pricing information for many products at once
+
+        Vectorized version of calculate_price: all arithmetic runs in NumPy,
+        so batches (spreadsheet imports, weight tuning, bulk AI
+        recommendations) avoid per-item Python interpreter overhead.
+
+        Args:
+            material_cost: Array of material costs in dollars
+            hours_worked: Array of hours spent creating each product
+            labor_rate: Array of hourly labor rates in dollars
+            uniqueness: Array of uniqueness ratings (1-10)
+            demand: Array of demand ratings (1-10)
+            selling_price: Optional array of user-set selling prices
+                           (0 or None means calculate automatically)
+
+        Returns:
+            PricingResults holding one array per field, with the same field
+            names as calculate_price
+        """
+        material_cost = np.asarray(material_cost, dtype=float)
+        hours_worked = np.asarray(hours_worked, dtype=float)
+        labor_rate = np.asarray(labor_rate, dtype=float)
+        uniqueness = np.asarray(uniqueness, dtype=float)
+        demand = np.asarray(demand, dtype=float)
+
         # Calculate base price (materials + labor)
         labor_cost = hours_worked * labor_rate
         base_price = material_cost + labor_cost
-        
-        # Calculate factor adjustments based on uniqueness and demand
-        uniqueness_adjustment = base_price * (uniqueness - 5) * self.uniqueness_weight
-        demand_adjustment = base_price * (demand - 5) * self.demand_weight
-        factor_adjustment = uniqueness_adjustment + demand_adjustment
-        
+
+        # Calculate factor adjustments based on uniqueness and demand.
+        # Operation order mirrors _calc_core exactly so scalar and batch
+        # produce bit-identical floats and round to the same cent
+        uniqueness_factor = (uniqueness - 5) * self.uniqueness_weight
+        demand_factor = (demand - 5) * self.demand_weight
+        uniqueness_adjustment = base_price * uniqueness_factor
+        demand_adjustment = base_price * demand_factor
+        factor_adjustment = base_price * (uniqueness_factor + demand_factor)
+
         # Calculate adjusted price (total costs with adjustments)
         adjusted_price = base_price + factor_adjustment
-        
-        # If user provided a selling price, use it; otherwise calculate suggested prices
-        if selling_price is not None and selling_price > 0:
-            final_price = selling_price
+
+        # Use user-provided selling prices where set; otherwise suggest one
+        suggested_price = adjusted_price * self.suggested_price_multiplier
+        if selling_price is not None:
+            selling_price = np.asarray(selling_price, dtype=float)
+            final_price = np.where(selling_price > 0, selling_price, suggested_price)
         else:
-            # Calculate suggested price based on typical multiplier
-            final_price = adjusted_price * self.suggested_price_multiplier
-            
+            selling_price = np.zeros_like(adjusted_price)
+            final_price = suggested_price
+
         # Calculate profit information
         profit_amount = final_price - adjusted_price
-        
+
         # Calculate profit margin percentage (as portion of final price)
-        if final_price > 0:
-            profit_margin_percentage = (profit_amount / final_price) * 100
-        else:
-            profit_margin_percentage = 0
-            
+        profit_margin_percentage = np.where(
+            final_price > 0, profit_amount / np.where(final_price > 0, final_price, 1) * 100, 0)
+
         # Calculate markup percentage (as portion of costs)
-        markup_percentage = (profit_amount / adjusted_price) * 100 if adjusted_price > 0 else 0
-        
+        markup_percentage = np.where(
+            adjusted_price > 0, profit_amount / np.where(adjusted_price > 0, adjusted_price, 1) * 100, 0)
+
         # Calculate alternate pricing options
         economy_price = final_price * self.economy_modifier
         premium_price = final_price * self.premium_modifier
-        
-        # Round prices to 2 decimal places
-        final_price = round(final_price, 2)
-        economy_price = round(economy_price, 2)
-        premium_price = round(premium_price, 2)
-        profit_amount = round(profit_amount, 2)
-        profit_margin_percentage = round(profit_margin_percentage, 2)
-        markup_percentage = round(markup_percentage, 2)
-        
-        # Return comprehensive results
-        return {
-            "material_cost": material_cost,
-            "labor_cost": labor_cost,
-            "base_price": base_price,
-            "uniqueness_adjustment": uniqueness_adjustment,
-            "demand_adjustment": demand_adjustment,
-            "factor_adjustment": factor_adjustment,
-            "adjusted_price": adjusted_price,  # This is the total cost
-            "profit_amount": profit_amount,
-            "profit_margin_percentage": profit_margin_percentage,
-            "markup_percentage": markup_percentage,
-            "final_price": final_price,
-            "economy_price": economy_price,
-            "premium_price": premium_price,
-            "selling_price": selling_price if selling_price is not None else 0
-        }
-    
-    def update_weights(self, uniqueness_weight=None, demand_weight=None, 
+
+        # Return comprehensive results (rounded like calculate_price)
+        return PricingResults(
+            material_cost=material_cost,
+            labor_cost=labor_cost,
+            base_price=base_price,
+            uniqueness_adjustment=uniqueness_adjustment,
+            demand_adjustment=demand_adjustment,
+            factor_adjustment=factor_adjustment,
+            adjusted_price=adjusted_price,
+            profit_amount=_round_cents(profit_amount),
+            profit_margin_percentage=_round_cents(profit_margin_percentage),
+            markup_percentage=_round_cents(markup_percentage),
+            final_price=_round_cents(final_price),
+            economy_price=_round_cents(economy_price),
+            premium_price=_round_cents(premium_price),
+            selling_price=selling_price
+        )
+
+    def update_weights(self, uniqueness_weight=None, demand_weight=None,
                      economy_modifier=None, premium_modifier=None,
                      suggested_price_multiplier=None):
         """Update the weighting parameters used in calculations"""
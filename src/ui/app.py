@@ -2,21 +2,67 @@
 Main UI application for the Pricing Assistant
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
+from typing import TYPE_CHECKING
 from src.logic.pricing import PricingCalculator
 from src.ui.input_frame import InputFrame
 from src.ui.result_frame import ResultFrame
 from src.ui.welcome_screen import WelcomeScreen
-from src.ui.chat_frame import ChatFrame
-from src.ai.models import PricingRecommendation
-from src.ai.chat_handler import ChatHandler
 import logging
 
+if TYPE_CHECKING:
+    from src.ai.models import PricingRecommendation
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Static help-tab content (module constant so it is allocated once)
+_HELP_TEXT = """
+Handmade Goods Pricing Assistant Help
+
+This application helps you determine optimal pricing for your handmade products based on various factors.
+
+AI Assistant:
+--------------------
+The application provides an AI assistant to help recommend pricing parameters based on a conversation about your product. To use this feature:
+
+1. Select "Use AI Pricing Assistant" on the welcome screen.
+2. Chat with the AI about your product, materials, time investment, and other factors.
+3. When ready, click "Get Recommendations" to generate pricing parameters.
+4. Review and apply the recommendations to the calculator.
+
+Price Calculator Tab:
+--------------------
+1. Enter your product's details in the input fields:
+   - Material Cost: The total cost of materials used in your product.
+   - Hours Worked: The number of hours spent creating the product.
+   - Labor Rate: Your desired hourly rate for your time.
+   - Uniqueness: How unique your product is on a scale of 1-10.
+   - Demand: The market demand for your product on a scale of 1-10.
+   - Selling Price (Optional): Your desired selling price. Leave at 0 for a suggested price.
+
+2. Click the "Calculate Price" button to see the recommended price and profit information.
+
+3. The results panel will show:
+   - The recommended or user-defined price
+   - Your profit amount and percentage
+   - A breakdown of price components
+   - Alternative pricing options (economy and premium)
+
+Tips for Pricing:
+---------------
+- Material Cost: Be sure to include all materials, even small amounts.
+- Labor Rate: Consider your skill level and the local market rates.
+- Uniqueness: Higher for items that require special skills or are one-of-a-kind.
+- Demand: Higher for items with proven market interest or during peak seasons.
+- Profit Analysis: The app will calculate both profit margin (% of selling price) and markup (% of costs).
+
+The pricing formula takes all these factors into account to help you determine a fair and sustainable price for your handmade goods.
+"""
+
 class PricingAssistantApp:
     """Main application class for the Handmade Goods Pricing Assistant"""
     
@@ -33,47 +79,83 @@ class PricingAssistantApp:
         
         self.calculator = PricingCalculator()
         
-        # Create a chat handler that can be reused
-        self.chat_handler = ChatHandler()
-        
+        # Chat handler is created on first use: importing the AI stack
+        # (openai, httpx, pydantic) costs hundreds of milliseconds, which
+        # would otherwise delay first paint for users who never open the chat
+        self.chat_handler = None
+
+        # Top-level screens are built once on first use and then swapped in
+        # and out with pack/pack_forget, so mode switches don't pay for
+        # widget reconstruction (notebook, help text, chart canvas, menu)
+        self.welcome_screen = None
+        self.chat_frame = None
+        self.main_frame = None
+        self._current_frame = None
+
+        # Pending debounced recalculation (after id), if any
+        self._calc_after_id = None
+
         # Initialize the UI with a welcome screen
         self._show_welcome_screen()
-    
+
+        # Warm the AI imports in the background once the UI is up, so the
+        # first click on the chat doesn't pay the import cost either
+        self.root.after(500, self._warm_ai_imports)
+
+    def _warm_ai_imports(self):
+        """Import the AI stack on a background thread."""
+        threading.Thread(
+            target=lambda: __import__("src.ai.chat_handler"), daemon=True).start()
+
+    def _swap_to(self, frame):
+        """
+        Make the given top-level frame the visible one.
+
+        Args:
+            frame: Frame to show (the currently shown frame is hidden)
+        """
+        if frame is self._current_frame:
+            return
+        if self._current_frame is not None:
+            self._current_frame.pack_forget()
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._current_frame = frame
+
     def _show_welcome_screen(self):
         """Show the welcome screen with options"""
-        self._clear_main_frame()
-        
-        # Create welcome screen
-        self.welcome_screen = WelcomeScreen(
-            self.root,
-            show_chat_callback=self._show_chat,
-            show_calculator_callback=self._setup_ui
-        )
-        self.welcome_screen.pack(fill=tk.BOTH, expand=True)
-    
+        if self.welcome_screen is None:
+            self.welcome_screen = WelcomeScreen(
+                self.root,
+                show_chat_callback=self._show_chat,
+                show_calculator_callback=self._setup_ui
+            )
+        self._swap_to(self.welcome_screen)
+
     def _show_chat(self):
         """Show the chat interface"""
-        self._clear_main_frame()
-        
-        # Reset the chat handler to start a fresh conversation
-        self.chat_handler.reset_conversation()
-        
-        # Create chat frame with our existing chat handler
-        self.chat_frame = ChatFrame(
-            self.root,
-            on_recommendations_ready=self._apply_recommendations,
-            on_cancel=self._setup_ui,
-            chat_handler=self.chat_handler
-        )
-        
-        self.chat_frame.pack(fill=tk.BOTH, expand=True)
-    
-    def _clear_main_frame(self):
-        """Clear any existing frames"""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-    
-    def _apply_recommendations(self, recommendations: PricingRecommendation):
+        # Deferred imports: the AI stack only loads when the chat is opened
+        from src.ai.chat_handler import ChatHandler
+        from src.ui.chat_frame import ChatFrame
+
+        if self.chat_handler is None:
+            self.chat_handler = ChatHandler()
+
+        if self.chat_frame is None:
+            # Create chat frame with our existing chat handler (it starts the
+            # conversation itself)
+            self.chat_frame = ChatFrame(
+                self.root,
+                on_recommendations_ready=self._apply_recommendations,
+                on_cancel=self._setup_ui,
+                chat_handler=self.chat_handler
+            )
+        else:
+            # Returning to the chat: start a fresh conversation
+            self.chat_frame.reset()
+
+        self._swap_to(self.chat_frame)
+
+    def _apply_recommendations(self, recommendations: "PricingRecommendation"):
         """
         Apply AI recommendations to the input form
         
@@ -96,8 +178,9 @@ class PricingAssistantApp:
         # Then immediately apply them to the form
         self.input_frame._reset_to_recommendations()
         
-        # Calculate and update results based on new values
-        self._calculate_price()
+        # Calculate and update results based on new values (immediately;
+        # this is a one-shot apply, not a stream of input events)
+        self._calculate_price_now()
         
         # Show a message about the source of the values
         messagebox.showinfo(
@@ -107,41 +190,42 @@ class PricingAssistantApp:
         )
     
     def _setup_ui(self):
-        """Set up the main UI components"""
-        self._clear_main_frame()
-        
-        # Create main frames
-        self.main_frame = ttk.Frame(self.root, padding="10")
-        self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Configure main frame for responsiveness
-        self.main_frame.columnconfigure(0, weight=1)
-        self.main_frame.rowconfigure(0, weight=1)
-        
-        # Create a notebook for different tabs
-        self.notebook = ttk.Notebook(self.main_frame)
-        self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Create main tabs
-        self.calculator_tab = ttk.Frame(self.notebook)
-        self.help_tab = ttk.Frame(self.notebook)
-        
-        # Configure tabs for responsiveness
-        for tab in [self.calculator_tab, self.help_tab]:
-            tab.columnconfigure(0, weight=1)
-            tab.rowconfigure(0, weight=1)
-        
-        self.notebook.add(self.calculator_tab, text="Price Calculator")
-        self.notebook.add(self.help_tab, text="Help")
-        
-        # Set up calculator tab
-        self._setup_calculator_tab()
-        
-        # Set up help tab
-        self._setup_help_tab()
-        
-        # Set up the menu
-        self._setup_menu()
+        """Show the main UI, building it on first use"""
+        if self.main_frame is None:
+            # Create main frames
+            self.main_frame = ttk.Frame(self.root, padding="10")
+
+            # Configure main frame for responsiveness
+            self.main_frame.columnconfigure(0, weight=1)
+            self.main_frame.rowconfigure(0, weight=1)
+
+            # Create a notebook for different tabs
+            self.notebook = ttk.Notebook(self.main_frame)
+            self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+            # Create main tabs
+            self.calculator_tab = ttk.Frame(self.notebook)
+            self.help_tab = ttk.Frame(self.notebook)
+
+            # Configure tabs for responsiveness
+            for tab in [self.calculator_tab, self.help_tab]:
+                tab.columnconfigure(0, weight=1)
+                tab.rowconfigure(0, weight=1)
+
+            self.notebook.add(self.calculator_tab, text="Price Calculator")
+            self.notebook.add(self.help_tab, text="Help")
+
+            # Set up calculator tab
+            self._setup_calculator_tab()
+
+            # Help tab contents are built the first time the user opens it
+            self._help_built = False
+            self.notebook.bind("<<NotebookTabChanged>>", self._maybe_build_help)
+
+            # Set up the menu
+            self._setup_menu()
+
+        self._swap_to(self.main_frame)
     
     def _setup_calculator_tab(self):
         """Set up the main calculator tab UI"""
@@ -164,15 +248,22 @@ class PricingAssistantApp:
         self.calc_paned = ttk.PanedWindow(calc_container, orient=tk.HORIZONTAL)
         self.calc_paned.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Input frame
-        self.input_frame = InputFrame(self.calc_paned, self._calculate_price)
-        
+        # Input frame (the explicit Calculate button recalculates
+        # immediately; no reason to debounce a deliberate click)
+        self.input_frame = InputFrame(self.calc_paned, self._calculate_price_now)
+
         # Result frame
         self.result_frame = ResultFrame(self.calc_paned)
-        
+
         # Add frames to paned window with appropriate weights
         self.calc_paned.add(self.input_frame, weight=40)
         self.calc_paned.add(self.result_frame, weight=60)
+
+        # Live results: every input change schedules the debounced
+        # recalculation, so typing and slider drags update the results once
+        # per pause instead of needing a button click per change
+        for var in self.input_frame.vars.values():
+            var.trace_add("write", lambda *args: self._calculate_price())
         
         # Schedule the sash position to be set after rendering
         self.root.after(100, self._set_paned_position)
@@ -183,6 +274,15 @@ class PricingAssistantApp:
         if width > 10:  # Only set if we have a valid width
             self.calc_paned.sashpos(0, int(width * 0.4))
     
+    def _maybe_build_help(self, event=None):
+        """Build the help tab contents the first time it is selected."""
+        if self._help_built:
+            return
+        if self.notebook.select() != str(self.help_tab):
+            return
+        self._help_built = True
+        self._setup_help_tab()
+
     def _setup_help_tab(self):
         """Set up the help tab UI"""
         # Create a frame for the help content
@@ -208,49 +308,7 @@ class PricingAssistantApp:
         help_frame.rowconfigure(1, weight=1)
         
         # Add help content
-        help_content = """
-Handmade Goods Pricing Assistant Help
-
-This application helps you determine optimal pricing for your handmade products based on various factors.
-
-AI Assistant:
---------------------
-The application provides an AI assistant to help recommend pricing parameters based on a conversation about your product. To use this feature:
-
-1. Select "Use AI Pricing Assistant" on the welcome screen.
-2. Chat with the AI about your product, materials, time investment, and other factors.
-3. When ready, click "Get Recommendations" to generate pricing parameters.
-4. Review and apply the recommendations to the calculator.
-
-Price Calculator Tab:
---------------------
-1. Enter your product's details in the input fields:
-   - Material Cost: The total cost of materials used in your product.
-   - Hours Worked: The number of hours spent creating the product.
-   - Labor Rate: Your desired hourly rate for your time.
-   - Uniqueness: How unique your product is on a scale of 1-10.
-   - Demand: The market demand for your product on a scale of 1-10.
-   - Selling Price (Optional): Your desired selling price. Leave at 0 for a suggested price.
-
-2. Click the "Calculate Price" button to see the recommended price and profit information.
-
-3. The results panel will show:
-   - The recommended or user-defined price
-   - Your profit amount and percentage
-   - A breakdown of price components
-   - Alternative pricing options (economy and premium)
-
-Tips for Pricing:
----------------
-- Material Cost: Be sure to include all materials, even small amounts.
-- Labor Rate: Consider your skill level and the local market rates.
-- Uniqueness: Higher for items that require special skills or are one-of-a-kind.
-- Demand: Higher for items with proven market interest or during peak seasons.
-- Profit Analysis: The app will calculate both profit margin (% of selling price) and markup (% of costs).
-
-The pricing formula takes all these factors into account to help you determine a fair and sustainable price for your handmade goods.
-"""
-        help_text.insert(tk.END, help_content)
+        help_text.insert(tk.END, _HELP_TEXT)
         help_text.configure(state='disabled')  # Make the text read-only
     
     def _setup_menu(self):
@@ -276,11 +334,35 @@ The pricing formula takes all these factors into account to help you determine a
         self.root.config(menu=self.menu_bar)
     
     def _calculate_price(self):
-        """Calculate the price based on the current input values"""
+        """
+        Schedule a price recalculation, coalescing rapid input changes.
+
+        Keystrokes and slider drags can fire many change events per second;
+        a 150 ms debounce recomputes once per pause instead of once per
+        event, keeping typing responsive.
+        """
+        if self._calc_after_id is not None:
+            self.root.after_cancel(self._calc_after_id)
+        # Input errors stay silent on this path: a half-typed value (e.g. a
+        # lone "-") would otherwise pop a modal dialog mid-keystroke. The
+        # results simply keep their last valid state until the input parses
+        self._calc_after_id = self.root.after(
+            150, lambda: self._calculate_price_now(show_errors=False))
+
+    def _calculate_price_now(self, show_errors=True):
+        """
+        Calculate the price based on the current input values
+
+        Args:
+            show_errors: Whether invalid input raises an error dialog; the
+                         debounced path passes False so transient states
+                         while typing never steal focus
+        """
+        self._calc_after_id = None
         try:
             # Get values from input frame
             values = self.input_frame.get_values()
-            
+
             # Calculate the price
             results = self.calculator.calculate_price(**values)
             
@@ -288,12 +370,14 @@ The pricing formula takes all these factors into account to help you determine a
             self.result_frame.update_results(results)
             
         except ValueError as e:
-            # Show error message
-            messagebox.showerror("Invalid Input", str(e))
+            # Show error message (explicit Calculate click only)
+            if show_errors:
+                messagebox.showerror("Invalid Input", str(e))
         except Exception as e:
-            # Log the error and show a generic message
+            # Log the error; a dialog per trace-triggered retry would spam
             logger.exception("Error calculating price")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            if show_errors:
+                messagebox.showerror("Error", f"An error occurred: {str(e)}")
     
     def _show_about(self):
         """Show about dialog"""
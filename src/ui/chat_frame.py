@@ -5,13 +5,60 @@ Chat interface for interacting with the AI assistant.
 import tkinter as tk
 from tkinter import ttk, scrolledtext, font
 from typing import Callable, Optional
-import threading
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import time
 
+from src.ai.cache import SemanticCache
 from src.ai.chat_handler import ChatHandler
 from src.ai.models import PricingRecommendation
 from src.ai.config import DEFAULT_PRICING_PARAMETERS
 
+# Fallback recommendation used when the AI is unavailable; data-independent,
+# so it is validated once at import instead of per request
+# Shared named fonts, created once per process (they need a Tk root, so
+# construction is deferred to first use). Named Font objects let Tk cache
+# the resolved font instead of re-resolving ("Arial", 10, ...) tuples on
+# every widget and tag configuration.
+_FONTS = None
+
+
+def _get_fonts():
+    """Return the shared chat fonts, creating them on first use."""
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = {
+            "base": font.Font(family="Arial", size=10),
+            "bold": font.Font(family="Arial", size=10, weight="bold"),
+            "system": font.Font(family="Arial", size=9, slant="italic"),
+        }
+    return _FONTS
+
+
+# Recommendation summary template, parsed once at import; filled in with
+# positional format() per display
+_SUMMARY_TEMPLATE = (
+    "Based on our conversation, here are my recommendations:\n\n"
+    "Material Cost: ${:.2f}\n"
+    "Hours Worked: {:.1f}\n"
+    "Labor Rate: ${:.2f}/hour\n"
+    "Uniqueness: {:.1f}/10\n"
+    "Demand: {:.1f}/10\n"
+    "Selling Price: {}\n\n"
+    "Explanation: {}"
+)
+
+_FALLBACK_RECOMMENDATION = PricingRecommendation(
+    material_cost=DEFAULT_PRICING_PARAMETERS["material_cost"],
+    hours_worked=DEFAULT_PRICING_PARAMETERS["hours_worked"],
+    labor_rate=DEFAULT_PRICING_PARAMETERS["labor_rate"],
+    uniqueness=DEFAULT_PRICING_PARAMETERS["uniqueness"],
+    demand=DEFAULT_PRICING_PARAMETERS["demand"],
+    selling_price=DEFAULT_PRICING_PARAMETERS["selling_price"],
+    explanation="These are default recommendations since the AI is not available. "
+              "In a real scenario, these would be generated based on our conversation."
+)
+
 class ChatFrame(ttk.Frame):
     """
     Chat interface for interacting with the AI assistant.
@@ -34,12 +81,60 @@ class ChatFrame(ttk.Frame):
         
         # Initialize chat handler
         self.chat_handler = chat_handler or ChatHandler()
-        
+
+        # Embedding-keyed cache: paraphrased repeats of earlier questions are
+        # answered locally (one embedding call) instead of a full completion
+        self._sem_cache = SemanticCache(
+            self.chat_handler.ai_client, threshold=0.92, max_entries=512)
+
         # UI state variables
         self.waiting_for_response = False
-        
+        # Handle to the "Apply Recommendations" button, if one is showing
+        self._apply_button = None
+
+        # Streamed response tokens cross from the worker thread through this
+        # queue; the main thread drains it on a ~30 Hz tick so rendering
+        # stays smooth even when tokens arrive faster than one per frame
+        self._stream_queue = queue.Queue()
+        self._streaming = False
+
+        # Single worker thread shared by all AI calls: avoids paying thread
+        # creation per message and serializes ChatHandler access, so two
+        # in-flight requests can never mutate conversation state concurrently
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat")
+
         self._setup_ui()
         self._start_conversation()
+
+    def _submit(self, fn, *args):
+        """
+        Run fn(*args) on the chat worker thread.
+
+        Args:
+            fn: Callable to run off the Tk main loop
+            *args: Arguments passed to fn
+        """
+        self._executor.submit(fn, *args)
+
+    def destroy(self):
+        """Shut down the worker thread along with the widget."""
+        self._executor.shutdown(wait=False)
+        super().destroy()
+
+    def reset(self):
+        """Clear the transcript and start a fresh conversation."""
+        self.chat_handler.reset_conversation()
+        # The cached responses are about the previous product; a paraphrased
+        # question in the new conversation must not be answered with them
+        self._sem_cache.clear()
+        if self._apply_button is not None:
+            self._apply_button.master.destroy()
+            self._apply_button = None
+        self.chat_history.config(state=tk.NORMAL)
+        self.chat_history.delete("1.0", tk.END)
+        self.chat_history.config(state=tk.DISABLED)
+        self.get_recommendations_button.config(state=tk.DISABLED)
+        self._start_conversation()
     
     def _setup_ui(self):
         """Set up the chat UI."""
@@ -53,28 +148,30 @@ class ChatFrame(ttk.Frame):
         content_frame.columnconfigure(0, weight=1)
         content_frame.rowconfigure(0, weight=1)
         
+        fonts = _get_fonts()
+
         # Chat history display
         self.chat_history = scrolledtext.ScrolledText(
-            content_frame, 
+            content_frame,
             wrap=tk.WORD,
             width=60,
             height=20,
-            font=("Arial", 10)
+            font=fonts["base"]
         )
         self.chat_history.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         self.chat_history.config(state=tk.DISABLED)
-        
+
         # Tag configuration for different message types
-        self.chat_history.tag_configure("user", foreground="#0055aa", font=("Arial", 10, "bold"))
-        self.chat_history.tag_configure("assistant", foreground="#008800", font=("Arial", 10, "bold"))
-        self.chat_history.tag_configure("system", foreground="#888888", font=("Arial", 9, "italic"))
+        self.chat_history.tag_configure("user", foreground="#0055aa", font=fonts["bold"])
+        self.chat_history.tag_configure("assistant", foreground="#008800", font=fonts["bold"])
+        self.chat_history.tag_configure("system", foreground="#888888", font=fonts["system"])
         
         # User input area
         input_frame = ttk.Frame(content_frame)
         input_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
         input_frame.columnconfigure(0, weight=1)
         
-        self.message_input = ttk.Entry(input_frame, font=("Arial", 10))
+        self.message_input = ttk.Entry(input_frame, font=fonts["base"])
         self.message_input.grid(row=0, column=0, sticky="ew", padx=(0, 5))
         self.message_input.bind("<Return>", lambda e: self._send_message())
         
@@ -111,8 +208,8 @@ class ChatFrame(ttk.Frame):
         """Start the initial conversation with the AI."""
         self._add_message("system", "Starting conversation with AI assistant...")
         
-        # Start in a separate thread to avoid blocking UI
-        threading.Thread(target=self._initial_greeting).start()
+        # Run on the worker thread to avoid blocking UI
+        self._submit(self._initial_greeting)
         
         # Enable the recommendations button after a reasonable chat
         self.after(10000, lambda: self.get_recommendations_button.config(state=tk.NORMAL))
@@ -138,18 +235,27 @@ class ChatFrame(ttk.Frame):
             sender_type: Type of sender ("user", "assistant", or "system")
             message: Message text
         """
-        self.chat_history.config(state=tk.NORMAL)
-        
         if sender_type == "user":
-            self.chat_history.insert(tk.END, "You: ", "user")
+            prefix, tag = "You: ", "user"
         elif sender_type == "assistant":
-            self.chat_history.insert(tk.END, "AI Assistant: ", "assistant")
+            prefix, tag = "AI Assistant: ", "assistant"
         else:  # system message
-            self.chat_history.insert(tk.END, "System: ", "system")
-        
-        self.chat_history.insert(tk.END, f"{message}\n\n")
+            prefix, tag = "System: ", "system"
+
+        # One insert call for prefix and body (Tk accepts alternating
+        # text/tags arguments) keeps the widget to a single reflow per
+        # message instead of one per fragment
+        self.chat_history.config(state=tk.NORMAL)
+        if sender_type == "system" and message == "AI is typing...":
+            # Mark where the typing indicator starts so it can later be
+            # removed by mark (O(1), and immune to multi-line miscounts)
+            self.chat_history.mark_set("typing_start", tk.END + "-1c")
+            self.chat_history.mark_gravity("typing_start", "left")
+        self.chat_history.insert(tk.END, prefix, tag, f"{message}\n\n", ())
         self.chat_history.config(state=tk.DISABLED)
-        self.chat_history.see(tk.END)
+        # Defer autoscroll until the event loop is idle so bursts of
+        # messages scroll once rather than per insert
+        self.chat_history.after_idle(self.chat_history.see, tk.END)
     
     def _send_message(self):
         """Send the user message to the AI."""
@@ -171,20 +277,97 @@ class ChatFrame(ttk.Frame):
         # Show typing indicator
         self._add_message("system", "AI is typing...")
         
-        # Process in a thread to avoid blocking UI
-        threading.Thread(target=self._process_message, args=(user_message,)).start()
+        # Process on the worker thread to avoid blocking UI
+        self._submit(self._process_message, user_message)
     
     def _process_message(self, user_message):
         """
-        Process the message in a separate thread.
+        Process the message on the chat worker thread.
         
         Args:
             user_message: Message from user
         """
-        response = self.chat_handler.send_message(user_message)
-        
-        # Update UI in the main thread
-        self.after(0, lambda: self._handle_response(response))
+        # Serve semantically similar repeats from the local cache, skipping
+        # the completion round-trip but keeping the conversation history
+        # consistent for later recommendation requests
+        cached = self._sem_cache.get(user_message)
+        if cached is not None:
+            self.chat_handler.record_exchange(user_message, cached)
+            self.after(0, lambda: self._handle_response(cached))
+            return
+
+        # Stream the response: tokens go into the queue as they arrive and
+        # the main thread renders them incrementally, so perceived latency is
+        # time-to-first-token rather than full generation time
+        self.after(0, self._begin_stream)
+        response = self.chat_handler.send_message(
+            user_message, on_token=self._stream_queue.put)
+        if response:
+            self._sem_cache.set(user_message, response)
+
+        # Finalize in the main thread (drains any remaining tokens)
+        self.after(0, lambda: self._finish_stream(response))
+
+    def _begin_stream(self):
+        """Prepare the chat widget for a streamed assistant response."""
+        # Remove typing indicator by its mark, then reuse the mark as the
+        # start of the streamed assistant block (so a failed stream can be
+        # rolled back the same way)
+        self.chat_history.config(state=tk.NORMAL)
+        self.chat_history.delete("typing_start", tk.END)
+        self.chat_history.insert(tk.END, "AI Assistant: ", "assistant", "\n\n", ())
+        self.chat_history.config(state=tk.DISABLED)
+
+        self._streaming = True
+        self.after(33, self._flush_stream)
+
+    def _flush_stream(self):
+        """Drain queued tokens into the chat widget (runs at ~30 Hz)."""
+        parts = []
+        try:
+            while True:
+                parts.append(self._stream_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if parts:
+            # Insert before the trailing blank line, one widget update per
+            # tick no matter how many tokens arrived
+            self.chat_history.config(state=tk.NORMAL)
+            self.chat_history.insert("end-3c", "".join(parts))
+            self.chat_history.config(state=tk.DISABLED)
+            self.chat_history.see(tk.END)
+
+        if self._streaming:
+            self.after(33, self._flush_stream)
+
+    def _finish_stream(self, response):
+        """
+        Finalize a streamed response and re-enable input.
+
+        Args:
+            response: Full response text, or None if the request failed
+        """
+        self._streaming = False
+        self._flush_stream()
+
+        if not response:
+            # Nothing streamed: roll back to the mark and show the usual
+            # failure notice instead
+            self.chat_history.config(state=tk.NORMAL)
+            self.chat_history.delete("typing_start", tk.END)
+            self.chat_history.config(state=tk.DISABLED)
+            self._add_message("system", "No response from AI. Please try again or use the calculator directly.")
+        self.chat_history.mark_unset("typing_start")
+
+        # Re-enable input
+        self.waiting_for_response = False
+        self.send_button.config(state=tk.NORMAL)
+        self.message_input.config(state=tk.NORMAL)
+        self.message_input.focus()
+
+        # Always enable get recommendations after a response
+        self.get_recommendations_button.config(state=tk.NORMAL)
     
     def _handle_response(self, response):
         """
@@ -193,11 +376,12 @@ class ChatFrame(ttk.Frame):
         Args:
             response: Response from AI
         """
-        # Remove typing indicator (last 2 lines + newlines)
+        # Remove typing indicator by its mark
         self.chat_history.config(state=tk.NORMAL)
-        self.chat_history.delete("end-3l", "end")
+        self.chat_history.delete("typing_start", tk.END)
+        self.chat_history.mark_unset("typing_start")
         self.chat_history.config(state=tk.DISABLED)
-        
+
         if response:
             self._add_message("assistant", response)
         else:
@@ -221,27 +405,19 @@ class ChatFrame(ttk.Frame):
         self.send_button.config(state=tk.DISABLED)
         self.message_input.config(state=tk.DISABLED)
         
-        # Process in a thread
-        threading.Thread(target=self._generate_recommendations).start()
+        # Process on the worker thread
+        self._submit(self._generate_recommendations)
     
     def _generate_recommendations(self):
-        """Generate the recommendations in a separate thread."""
+        """Generate the recommendations on the chat worker thread."""
         recommendations = self.chat_handler.get_recommendations()
         
         # If no recommendations and no AI client, create a fallback recommendation
         if recommendations is None and (not self.chat_handler.ai_client.is_available()):
-            # Create a fallback recommendation based on the conversation and default values
-            recommendations = PricingRecommendation(
-                material_cost=DEFAULT_PRICING_PARAMETERS["material_cost"],
-                hours_worked=DEFAULT_PRICING_PARAMETERS["hours_worked"],
-                labor_rate=DEFAULT_PRICING_PARAMETERS["labor_rate"],
-                uniqueness=DEFAULT_PRICING_PARAMETERS["uniqueness"],
-                demand=DEFAULT_PRICING_PARAMETERS["demand"],
-                selling_price=DEFAULT_PRICING_PARAMETERS["selling_price"],
-                explanation="These are default recommendations since the AI is not available. "
-                          "In a real scenario, these would be generated based on our conversation."
-            )
-            
+            # Reuse the prebuilt fallback (copied so callers can't mutate the
+            # shared constant)
+            recommendations = _FALLBACK_RECOMMENDATION.model_copy()
+
             # Log the fallback recommendations
             self.after(0, lambda: self._add_message("system", 
                 "Using default recommendations since the AI is not available. "
@@ -259,36 +435,36 @@ class ChatFrame(ttk.Frame):
         """
         if recommendations:
             # Show recommendations in chat
-            summary = (
-                f"Based on our conversation, here are my recommendations:\n\n"
-                f"Material Cost: ${recommendations.material_cost:.2f}\n"
-                f"Hours Worked: {recommendations.hours_worked:.1f}\n"
-                f"Labor Rate: ${recommendations.labor_rate:.2f}/hour\n"
-                f"Uniqueness: {recommendations.uniqueness:.1f}/10\n"
-                f"Demand: {recommendations.demand:.1f}/10\n"
-                f"Selling Price: {'Auto-calculate' if recommendations.selling_price == 0 else f'${recommendations.selling_price:.2f}'}\n\n"
-                f"Explanation: {recommendations.explanation}"
+            summary = _SUMMARY_TEMPLATE.format(
+                recommendations.material_cost,
+                recommendations.hours_worked,
+                recommendations.labor_rate,
+                recommendations.uniqueness,
+                recommendations.demand,
+                'Auto-calculate' if recommendations.selling_price == 0
+                else f'${recommendations.selling_price:.2f}',
+                recommendations.explanation
             )
-            
+
             self._add_message("assistant", summary)
-            
-            # Remove any existing apply button
-            for widget in self.winfo_children():
-                if isinstance(widget, ttk.Button) and widget.cget("text") == "Apply Recommendations":
-                    widget.destroy()
-            
+
+            # Remove any existing apply button (and its container) via the
+            # stored handle instead of a per-child cget scan of the tree
+            if self._apply_button is not None:
+                self._apply_button.master.destroy()
+
             # Create a new button frame at the bottom
             button_frame = ttk.Frame(self)
             button_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
-            
+
             # Create Apply button in this frame
-            apply_button = ttk.Button(
-                button_frame, 
+            self._apply_button = ttk.Button(
+                button_frame,
                 text="Apply Recommendations",
                 command=lambda: self.on_recommendations_ready(recommendations)
             )
-            apply_button.pack(fill=tk.X, expand=True, padx=5, pady=5)
-            
+            self._apply_button.pack(fill=tk.X, expand=True, padx=5, pady=5)
+
             # Re-enable input 
             self.get_recommendations_button.config(state=tk.NORMAL)
             self.send_button.config(state=tk.NORMAL)
@@ -3,13 +3,44 @@ Input frame for the Pricing Assistant
 Handles collecting user inputs for price calculation
 """
 
+import re
 import tkinter as tk
 from tkinter import ttk
 from functools import partial
 
+# Precompiled numeric-entry pattern: digits with optional sign and one
+# decimal point (empty and partial inputs like "-" or "3." are allowed
+# while typing)
+_NUM_RE = re.compile(r"-?\d*\.?\d*")
+
 class InputFrame(ttk.Frame):
     """Input frame for collecting user input values"""
-    
+
+    # Predefined sample scenarios (selling_price 0 means "use suggested")
+    _SCENARIOS = {
+        1: {  # Simple Jewelry
+            "material_cost": 5.0, "hours_worked": 2.0, "labor_rate": 15.0,
+            "uniqueness": 6.0, "demand": 7.0, "selling_price": 0.0
+        },
+        2: {  # Complex Art
+            "material_cost": 25.0, "hours_worked": 8.0, "labor_rate": 20.0,
+            "uniqueness": 9.0, "demand": 5.0, "selling_price": 0.0
+        },
+        3: {  # Batch Production
+            "material_cost": 3.0, "hours_worked": 0.5, "labor_rate": 15.0,
+            "uniqueness": 4.0, "demand": 8.0, "selling_price": 0.0
+        }
+    }
+
+    # Attribute-style access to the variables, for readability at the
+    # widget-wiring call sites
+    material_cost_var = property(lambda self: self.vars["material_cost"])
+    hours_worked_var = property(lambda self: self.vars["hours_worked"])
+    labor_rate_var = property(lambda self: self.vars["labor_rate"])
+    uniqueness_var = property(lambda self: self.vars["uniqueness"])
+    demand_var = property(lambda self: self.vars["demand"])
+    selling_price_var = property(lambda self: self.vars["selling_price"])
+
     def __init__(self, parent, calculate_callback):
         super().__init__(parent, padding="10")
         self.calculate_callback = calculate_callback
@@ -26,16 +57,46 @@ class InputFrame(ttk.Frame):
         
         # Store recommended values (initially None)
         self.recommended_values = None
-        
-        # Input variables
-        self.material_cost_var = tk.DoubleVar(value=self.default_values["material_cost"])
-        self.hours_worked_var = tk.DoubleVar(value=self.default_values["hours_worked"])
-        self.labor_rate_var = tk.DoubleVar(value=self.default_values["labor_rate"])
-        self.uniqueness_var = tk.DoubleVar(value=self.default_values["uniqueness"])
-        self.demand_var = tk.DoubleVar(value=self.default_values["demand"])
-        self.selling_price_var = tk.DoubleVar(value=self.default_values["selling_price"])
-        
+
+        # Pending debounced slider commits (after ids)
+        self._uniq_after = None
+        self._dem_after = None
+
+        # Reentrancy guard for the slider<->entry sync cycle: a slider move
+        # writes the var, whose trace pushes the value back to the slider,
+        # which can re-fire the slider command. The guard suppresses the echo
+        # so each user action costs one pass instead of a ping-pong.
+        self._syncing = False
+
+        # Bulk-update flag: suppresses per-write slider syncs while a
+        # scenario sets all six vars, which are then applied in one pass
+        self._bulk = False
+        
+        # Input variables, keyed by field name so resets, scenario loads and
+        # trace setup can iterate instead of repeating six parallel lines
+        self.vars = {name: tk.DoubleVar(value=float(default))
+                     for name, default in self.default_values.items()}
+
+        # Shadow copies of the input values as plain floats, refreshed by
+        # write traces. get_values() reads these dict entries instead of
+        # paying a Python->Tcl->Python round-trip per DoubleVar.get()
+        self._shadow = {name: float(value) for name, value in self.default_values.items()}
+        for name, var in self.vars.items():
+            var.trace_add("write", partial(self._update_shadow, name, var))
+
+        # Scenario button callbacks, pre-bound once so _setup_ui just
+        # references them instead of allocating a partial per button
+        self._scenario_cmds = tuple(
+            partial(self._load_scenario, num) for num in (1, 2, 3))
+
         self._setup_ui()
+
+    def _update_shadow(self, name, var, *args):
+        """Mirror a variable write into the shadow dict"""
+        try:
+            self._shadow[name] = float(var.get())
+        except (ValueError, tk.TclError):
+            pass  # Mid-edit value (e.g. empty entry); keep the last good one
     
     def _setup_ui(self):
         """Set up the input form UI"""
@@ -99,22 +160,53 @@ class InputFrame(ttk.Frame):
         self.uniqueness_var.trace_add("write", lambda *args: self._sync_slider_from_entry(
             self.uniqueness_var, uniqueness_slider, 1.0, 10.0))
         
-        # Handle slider release - snap to nearest 0.1
+        def commit_uniqueness(rounded):
+            self._uniq_after = None
+            self._syncing = True
+            try:
+                self.uniqueness_var.set(rounded)
+            finally:
+                self._syncing = False
+
+        # Handle slider release - snap to nearest 0.1 (flushes any pending
+        # debounced commit so the final value is never lost)
         def on_uniqueness_release(event):
+            pending = self._uniq_after is not None
+            if pending:
+                self.after_cancel(self._uniq_after)
+                self._uniq_after = None
             current = float(uniqueness_slider.get())
             rounded = round(current * 10) / 10  # Round to nearest 0.1
-            uniqueness_slider.set(rounded)
-            self.uniqueness_var.set(rounded)
-        
+            if current == rounded:
+                # Already snapped (motion rounds during the drag, so this is
+                # the common case): skip the slider/var writes and their
+                # traces, only flushing a still-pending debounced commit
+                if pending:
+                    commit_uniqueness(rounded)
+                return
+            self._syncing = True
+            try:
+                uniqueness_slider.set(rounded)
+                self.uniqueness_var.set(rounded)
+            finally:
+                self._syncing = False
+
         uniqueness_slider.bind("<ButtonRelease-1>", on_uniqueness_release)
-        
-        # Also round during the slider drag operation
+
+        # Round during the drag, but debounce the variable write: motion
+        # events fire per pixel, so committing once per ~30 ms frame avoids
+        # a var-set/trace round-trip storm
         def on_uniqueness_motion(value):
+            if self._syncing:
+                return  # Echo of a programmatic slider.set; already settled
             rounded = round(float(value) * 10) / 10  # Round to nearest 0.1
-            self.uniqueness_var.set(rounded)
+            if self._uniq_after is not None:
+                self.after_cancel(self._uniq_after)
+            self._uniq_after = self.after(30, commit_uniqueness, rounded)
             return rounded
-        
+
         uniqueness_slider.configure(command=on_uniqueness_motion)
+        self._uniqueness_slider = uniqueness_slider
         
         # Demand slider and entry
         ttk.Label(factors_frame, text="Demand:").grid(row=1, column=0, sticky="w", pady=2)
@@ -139,22 +231,50 @@ class InputFrame(ttk.Frame):
         self.demand_var.trace_add("write", lambda *args: self._sync_slider_from_entry(
             self.demand_var, demand_slider, 1.0, 10.0))
         
-        # Handle slider release - snap to nearest 0.1
+        def commit_demand(rounded):
+            self._dem_after = None
+            self._syncing = True
+            try:
+                self.demand_var.set(rounded)
+            finally:
+                self._syncing = False
+
+        # Handle slider release - snap to nearest 0.1 (flushes any pending
+        # debounced commit so the final value is never lost)
         def on_demand_release(event):
+            pending = self._dem_after is not None
+            if pending:
+                self.after_cancel(self._dem_after)
+                self._dem_after = None
             current = float(demand_slider.get())
             rounded = round(current * 10) / 10  # Round to nearest 0.1
-            demand_slider.set(rounded)
-            self.demand_var.set(rounded)
-        
+            if current == rounded:
+                # Already snapped: same early-exit as the uniqueness slider
+                if pending:
+                    commit_demand(rounded)
+                return
+            self._syncing = True
+            try:
+                demand_slider.set(rounded)
+                self.demand_var.set(rounded)
+            finally:
+                self._syncing = False
+
         demand_slider.bind("<ButtonRelease-1>", on_demand_release)
-        
-        # Also round during the slider drag operation
+
+        # Round during the drag, but debounce the variable write (see the
+        # uniqueness slider above)
         def on_demand_motion(value):
+            if self._syncing:
+                return  # Echo of a programmatic slider.set; already settled
             rounded = round(float(value) * 10) / 10  # Round to nearest 0.1
-            self.demand_var.set(rounded)
+            if self._dem_after is not None:
+                self.after_cancel(self._dem_after)
+            self._dem_after = self.after(30, commit_demand, rounded)
             return rounded
-        
+
         demand_slider.configure(command=on_demand_motion)
+        self._demand_slider = demand_slider
         
         # Price section (renamed from Profit section)
         price_frame = ttk.LabelFrame(self, text="Price Input (Optional)", padding=10)
@@ -182,16 +302,16 @@ class InputFrame(ttk.Frame):
         scenarios_frame.columnconfigure(2, weight=1)
         
         # Scenario 1: Simple Jewelry
-        ttk.Button(scenarios_frame, text="Simple Jewelry", 
-                  command=partial(self._load_scenario, 1)).grid(row=0, column=0, padx=5, pady=5, sticky="ew")
-        
+        ttk.Button(scenarios_frame, text="Simple Jewelry",
+                  command=self._scenario_cmds[0]).grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+
         # Scenario 2: Complex Art
-        ttk.Button(scenarios_frame, text="Complex Art", 
-                  command=partial(self._load_scenario, 2)).grid(row=0, column=1, padx=5, pady=5, sticky="ew")
-        
+        ttk.Button(scenarios_frame, text="Complex Art",
+                  command=self._scenario_cmds[1]).grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+
         # Scenario 3: Batch Production
-        ttk.Button(scenarios_frame, text="Batch Item", 
-                  command=partial(self._load_scenario, 3)).grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        ttk.Button(scenarios_frame, text="Batch Item",
+                  command=self._scenario_cmds[2]).grid(row=0, column=2, padx=5, pady=5, sticky="ew")
         
         # Calculate button
         calculate_button = ttk.Button(self, text="Calculate Price", command=self.calculate_callback)
@@ -214,30 +334,29 @@ class InputFrame(ttk.Frame):
     
     def _load_scenario(self, scenario_num):
         """Load a predefined scenario"""
-        if scenario_num == 1:
-            # Simple Jewelry
-            self.material_cost_var.set(5.0)
-            self.hours_worked_var.set(2.0)
-            self.labor_rate_var.set(15.0)
-            self.uniqueness_var.set(6.0)
-            self.demand_var.set(7.0)
-            self.selling_price_var.set(0.0)  # Not set, use suggested price
-        elif scenario_num == 2:
-            # Complex Art
-            self.material_cost_var.set(25.0)
-            self.hours_worked_var.set(8.0)
-            self.labor_rate_var.set(20.0)
-            self.uniqueness_var.set(9.0)
-            self.demand_var.set(5.0)
-            self.selling_price_var.set(0.0)  # Not set, use suggested price
-        elif scenario_num == 3:
-            # Batch Production
-            self.material_cost_var.set(3.0)
-            self.hours_worked_var.set(0.5)
-            self.labor_rate_var.set(15.0)
-            self.uniqueness_var.set(4.0)
-            self.demand_var.set(8.0)
-            self.selling_price_var.set(0.0)  # Not set, use suggested price
+        # Suppress per-write slider syncs while all six vars are set, then
+        # position the sliders once at the end - one update pass instead of
+        # a trace/redraw cycle per variable
+        scenario = self._SCENARIOS.get(scenario_num)
+        if scenario is None:
+            return
+
+        self._bulk = True
+        try:
+            for name, value in scenario.items():
+                self.vars[name].set(value)
+        finally:
+            self._bulk = False
+        self._apply_sliders()
+
+    def _apply_sliders(self):
+        """Push the current uniqueness/demand values to their sliders once"""
+        self._syncing = True
+        try:
+            self._uniqueness_slider.set(max(1.0, min(10.0, self._shadow["uniqueness"])))
+            self._demand_slider.set(max(1.0, min(10.0, self._shadow["demand"])))
+        finally:
+            self._syncing = False
     
     def _reset_values(self):
         """Reset values based on what's available (kept for compatibility)"""
@@ -248,27 +367,20 @@ class InputFrame(ttk.Frame):
     
     def _reset_to_defaults(self):
         """Reset all values to original defaults"""
-        self.material_cost_var.set(self.default_values["material_cost"])
-        self.hours_worked_var.set(self.default_values["hours_worked"])
-        self.labor_rate_var.set(self.default_values["labor_rate"])
-        self.uniqueness_var.set(float(self.default_values["uniqueness"]))
-        self.demand_var.set(float(self.default_values["demand"]))
-        self.selling_price_var.set(self.default_values["selling_price"])
-    
+        for name, value in self.default_values.items():
+            self.vars[name].set(float(value))
+
     def _reset_to_recommendations(self):
         """Reset all values to AI recommendations (if available)"""
         if not self.recommended_values:
             return
-            
-        self.material_cost_var.set(self.recommended_values["material_cost"])
-        self.hours_worked_var.set(self.recommended_values["hours_worked"])
-        self.labor_rate_var.set(self.recommended_values["labor_rate"])
-        self.uniqueness_var.set(self.recommended_values["uniqueness"])
-        self.demand_var.set(self.recommended_values["demand"])
-        if "selling_price" in self.recommended_values:
-            self.selling_price_var.set(self.recommended_values["selling_price"])
-        else:
-            self.selling_price_var.set(0.0)  # Not set, use suggested price
+
+        for name, var in self.vars.items():
+            if name == "selling_price":
+                # Absent selling_price means "use suggested price"
+                var.set(self.recommended_values.get(name, 0.0))
+            else:
+                var.set(self.recommended_values[name])
     
     def set_recommendations(self, recommendations):
         """
@@ -278,34 +390,30 @@ class InputFrame(ttk.Frame):
             recommendations: Dictionary with recommended values or PricingRecommendation object
         """
         # Allow passing either a dictionary or a PricingRecommendation object
-        if hasattr(recommendations, "__dict__"):
-            # Convert PricingRecommendation object to dict
+        if isinstance(recommendations, dict):
+            self.recommended_values = recommendations
+        else:
+            # Pull the known fields off the object in one pass (the old
+            # hasattr(..., "__dict__") probe was true for nearly everything)
             self.recommended_values = {
-                "material_cost": recommendations.material_cost,
-                "hours_worked": recommendations.hours_worked,
-                "labor_rate": recommendations.labor_rate,
-                "uniqueness": recommendations.uniqueness,
-                "demand": recommendations.demand
+                name: getattr(recommendations, name)
+                for name in self.vars
+                if hasattr(recommendations, name)
             }
-            # Only add selling_price if it exists
-            if hasattr(recommendations, "selling_price"):
-                self.recommended_values["selling_price"] = recommendations.selling_price
-        else:
-            # Already a dictionary
-            self.recommended_values = recommendations
             
         # Enable the recommendations reset button
         self.reset_recom_button.config(state=tk.NORMAL)
     
     def get_values(self):
         """Get all input values as a dictionary"""
-        # Validate inputs
-        material_cost = self.material_cost_var.get()
-        hours_worked = self.hours_worked_var.get()
-        labor_rate = self.labor_rate_var.get()
-        uniqueness = round(self.uniqueness_var.get(), 1)  # Round to 1 decimal place
-        demand = round(self.demand_var.get(), 1)          # Round to 1 decimal place
-        selling_price = self.selling_price_var.get()
+        # Read from the shadow dict (kept in sync by write traces) rather
+        # than issuing a Tcl call per variable
+        material_cost = self._shadow["material_cost"]
+        hours_worked = self._shadow["hours_worked"]
+        labor_rate = self._shadow["labor_rate"]
+        uniqueness = round(self._shadow["uniqueness"], 1)  # Round to 1 decimal place
+        demand = round(self._shadow["demand"], 1)          # Round to 1 decimal place
+        selling_price = self._shadow["selling_price"]
         
         # Validate that all numeric inputs are positive
         if material_cost < 0:
@@ -328,14 +436,10 @@ class InputFrame(ttk.Frame):
         }
     
     def _validate_float_input(self, value):
-        """Validate that the input can be converted to a float"""
-        if value == "":
-            return True
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+        """Validate that the input looks like a (possibly partial) float"""
+        # A precompiled regex match per keystroke instead of a try/except
+        # float() parse, whose exception path is the slow one
+        return _NUM_RE.fullmatch(value) is not None
     
     def _validate_uniqueness(self, value):
         """Update the uniqueness variable when the slider is moved"""
@@ -349,9 +453,15 @@ class InputFrame(ttk.Frame):
     
     def _sync_slider_from_entry(self, var, slider, min_val, max_val):
         """Sync slider position from the entry value"""
+        if self._syncing or self._bulk:
+            return  # Slider echo, or a bulk load that applies sliders itself
         try:
             value = float(var.get())
             value = max(min_val, min(max_val, value))  # Clamp to valid range
-            slider.set(value)
+            self._syncing = True
+            try:
+                slider.set(value)
+            finally:
+                self._syncing = False
         except (ValueError, tk.TclError):
             pass  # Ignore invalid values 
\ No newline at end of file
@@ -5,8 +5,21 @@ Displays calculation results and visualizations
 
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# matplotlib is imported lazily in _init_chart: its import chain (plus font
+# cache) costs hundreds of ms and would otherwise delay first paint
+
+# Bound format methods: the format strings are parsed once at import instead
+# of per update
+_FMT = "${:.2f}".format
+_PCT = "{:.1f}%".format
+
+# Chart structure constants.
+# Bar colors switched from the original:
+# Original: Material (green), Labor (blue), Factors (yellow), Profit (red)
+# New: Material (red), Labor (yellow), Factors (blue), Profit (green)
+_COMPONENTS = ('Material', 'Labor', 'Factors', 'Profit')
+_COLORS = ('#F44336', '#FFC107', '#2196F3', '#4CAF50')
 
 class ResultFrame(ttk.Frame):
     """Result frame for displaying calculation results"""
@@ -100,106 +113,190 @@ class ResultFrame(ttk.Frame):
         ttk.Label(options_frame, textvariable=self.premium_price_var).grid(
             row=1, column=1, sticky="e", pady=2)
         
-        # Create initial empty chart
-        self._create_empty_chart()
-    
-    def _create_empty_chart(self):
-        """Create an empty placeholder chart"""
-        # Clear any existing chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-        
-        # Create figure with responsive sizing
-        self.fig = plt.figure(figsize=(5, 3), dpi=100)
-        self.fig.subplots_adjust(left=0.15, bottom=0.2, right=0.85, top=0.9)
+        # Chart construction is deferred off __init__: the main window paints
+        # first and the chart (including the matplotlib import) fills in on
+        # the next idle tick. update_results forces it synchronously if a
+        # result arrives before that.
+        self._chart_ready = False
+        self.after_idle(self._ensure_chart)
+
+    def _ensure_chart(self):
+        """Build the chart now if the deferred init hasn't run yet"""
+        if not self._chart_ready:
+            self._init_chart()
+
+    def _init_chart(self):
+        """Build the chart figure, canvas and persistent artists (once)"""
+        # Deferred import: matplotlib only loads when a chart is needed
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self._chart_ready = True
+
+        # Create the figure and canvas once; updates only redraw the axes.
+        # Figure/axes/canvas construction costs hundreds of ms, so it must
+        # not happen per result
+        # Plain Figure (not pyplot) keeps the figure out of pyplot's global
+        # Gcf registry: no leaked reference, no global state on draws
+        self.fig = Figure(figsize=(5, 3), dpi=100)
+        # Increase top margin to prevent clipping
+        self.fig.subplots_adjust(left=0.15, bottom=0.3, right=0.85, top=0.85)
         self.ax = self.fig.add_subplot(111)
-        
-        # Add text to empty chart
-        self.ax.text(0.5, 0.5, "No data to display", 
-                   ha='center', va='center', fontsize=12)
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        
-        # Create canvas with responsive sizing
-        canvas = FigureCanvasTkAgg(self.fig, master=self.chart_frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill=tk.BOTH, expand=True)
-        
-        # Make sure the canvas adjusts when the window is resized
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.chart_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Make sure the canvas adjusts when the window is resized (bound
+        # once for the lifetime of the frame)
         self.chart_frame.bind("<Configure>", lambda e: self._on_resize())
-    
+
+        # Static chart structure, built once: the four bars and their value
+        # labels are persistent artists; updates only change their heights
+        # and texts. Marking them animated makes full draws skip them so
+        # they can be blitted over a cached background.
+        bar_container = self.ax.bar(
+            _COMPONENTS, [0.0] * len(_COMPONENTS), color=_COLORS)
+        self._bars = list(bar_container)
+        # One bar_label call creates all four value labels as annotations
+        # anchored 3 pt above the bar tops; updates just move the anchors
+        self._bar_labels = list(self.ax.bar_label(
+            bar_container, fmt='$%.2f', padding=3, fontsize=8))
+        for artist in self._bars + self._bar_labels:
+            artist.set_animated(True)
+
+        # Placeholder shown until the first result arrives
+        self._placeholder = self.ax.text(0.5, 0.5, "No data to display",
+                                         ha='center', va='center', fontsize=12,
+                                         transform=self.ax.transAxes)
+
+        # Cached background for blitting; None means the next update must do
+        # a full draw. _y_max is the current y-axis limit (None = no data)
+        self._bg = None
+        self._y_max = None
+
+        # Pending debounced resize relayout (after id), if any
+        self._resize_after = None
+
+        # Recapture the background (and repaint the bars) whenever anything
+        # triggers a full redraw, e.g. a resize
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Show the initial empty chart
+        self._create_empty_chart()
+
+    def _create_empty_chart(self):
+        """Show the empty placeholder chart"""
+        self._placeholder.set_visible(True)
+        self.ax.set_axis_off()
+        self._y_max = None
+        self._bg = None
+        self.canvas.draw_idle()
+
     def _on_resize(self):
-        """Handle resizing of the chart"""
+        """
+        Handle resizing of the chart.
+
+        <Configure> fires for every pixel of a resize drag; the expensive
+        tight_layout pass is debounced to run once, 100 ms after the resize
+        settles.
+        """
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(100, self._do_resize)
+
+    def _do_resize(self):
+        """Re-run the layout solver after a resize has settled"""
+        self._resize_after = None
         if hasattr(self, 'fig') and self.fig is not None:
             self.fig.tight_layout()
-            self.fig.canvas.draw_idle()
-    
+            self._bg = None  # Background geometry changed
+            self.canvas.draw_idle()
+
+    def _on_draw(self, event):
+        """Recapture the blit background after any full redraw."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self._y_max is not None:
+            self._draw_animated()
+
+    def _draw_animated(self):
+        """Render the bar and label artists onto the current canvas buffer."""
+        for artist in self._bars + self._bar_labels:
+            self.ax.draw_artist(artist)
+
     def _create_price_breakdown_chart(self, result):
-        """Create a chart showing the price breakdown"""
-        # Clear any existing chart
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-        
-        # Create figure with responsive sizing
-        self.fig = plt.figure(figsize=(5, 3), dpi=100)
-        # Increase top margin to prevent clipping
-        self.fig.subplots_adjust(left=0.15, bottom=0.3, right=0.85, top=0.85)
-        self.ax = self.fig.add_subplot(111)
-        
+        """Update the chart showing the price breakdown"""
         # Data for the chart
-        components = ['Material', 'Labor', 'Factors', 'Profit']
         values = [
-            result["material_cost"],
-            result["labor_cost"],
-            result["factor_adjustment"],
-            result["profit_amount"]
+            result.material_cost,
+            result.labor_cost,
+            result.factor_adjustment,
+            result.profit_amount
         ]
-        
-        # Create bar chart with switched colors:
-        # Original: Material (green), Labor (blue), Factors (yellow), Profit (red)
-        # New: Material (red), Labor (yellow), Factors (blue), Profit (green)
-        bars = self.ax.bar(components, values, color=['#F44336', '#FFC107', '#2196F3', '#4CAF50'])
-        
-        # Add labels and formatting
-        self.ax.set_title('Price Components')
-        self.ax.set_ylabel('Amount ($)')
-        
-        # Add values above bars
-        for bar in bars:
-            height = bar.get_height()
-            self.ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'${height:.2f}', ha='center', va='bottom', fontsize=8)
-        
+
+        # Update the persistent artists in place
+        for bar, label, value in zip(self._bars, self._bar_labels, values):
+            bar.set_height(value)
+            label.xy = (label.xy[0], value)  # padding keeps the 3 pt offset
+            label.set_text(_FMT(value))
+
+        if self._y_max is None:
+            # First data: swap the placeholder for the real axes
+            self._placeholder.set_visible(False)
+            self.ax.set_axis_on()
+            self.ax.set_title('Price Components')
+            self.ax.set_ylabel('Amount ($)')
+
         # Add padding to y-axis to prevent text clipping
         y_max = max(values) * 1.15  # Add 15% padding to the top
-        self.ax.set_ylim(0, y_max)
-        
-        # Create canvas with responsive sizing
-        canvas = FigureCanvasTkAgg(self.fig, master=self.chart_frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(fill=tk.BOTH, expand=True)
-        
-        # Make sure the canvas adjusts when the window is resized
-        self.chart_frame.bind("<Configure>", lambda e: self._on_resize())
+        if self._y_max is None or y_max > self._y_max or y_max < self._y_max * 0.5:
+            # Only rescale when the bars would clip (grow) or the axis has
+            # become mostly empty (shrink below half). The hysteresis keeps
+            # similar-magnitude recalcs from re-ticking the y-axis, so their
+            # cached blit background stays valid
+            self._y_max = y_max
+            self.ax.set_ylim(0, y_max)
+            self._bg = None
+
+        if self._bg is None:
+            # Full draw, deferred to the next idle tick so back-to-back
+            # updates coalesce; _on_draw then recaptures the background and
+            # paints the bars
+            self.canvas.draw_idle()
+        else:
+            # Only the bars changed: restore the cached background and blit
+            # just the updated artists
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self.ax.bbox)
     
+    def _set_if_changed(self, var, value):
+        """Write a display variable only when its value actually changed.
+
+        Skipping no-op writes avoids the write-trace and label invalidation
+        Tk performs on every set, so recalculations with unchanged inputs
+        cost no redraws.
+        """
+        if var.get() != value:
+            var.set(value)
+
     def update_results(self, result):
         """Update the display with calculation results"""
+        # Build the chart first if the deferred init hasn't run yet
+        self._ensure_chart()
+
         # Format currency values
-        self.recommended_price_var.set(f"${result['final_price']:.2f}")
-        self.base_price_var.set(f"${result['base_price']:.2f}")
-        self.economy_price_var.set(f"${result['economy_price']:.2f}")
-        self.premium_price_var.set(f"${result['premium_price']:.2f}")
-        self.profit_amount_var.set(f"${result['profit_amount']:.2f}")
-        
+        self._set_if_changed(self.recommended_price_var, _FMT(result.final_price))
+        self._set_if_changed(self.base_price_var, _FMT(result.base_price))
+        self._set_if_changed(self.economy_price_var, _FMT(result.economy_price))
+        self._set_if_changed(self.premium_price_var, _FMT(result.premium_price))
+        self._set_if_changed(self.profit_amount_var, _FMT(result.profit_amount))
+
         # Set profit margin and markup to N/A if selling price is 0
-        if 'selling_price' in result and result['selling_price'] == 0:
-            self.profit_margin_var.set("N/A")
-            self.markup_percentage_var.set("N/A")
+        if result.selling_price == 0:
+            self._set_if_changed(self.profit_margin_var, "N/A")
+            self._set_if_changed(self.markup_percentage_var, "N/A")
         else:
-            self.profit_margin_var.set(f"{result['profit_margin_percentage']:.1f}%")
-            self.markup_percentage_var.set(f"{result['markup_percentage']:.1f}%")
+            self._set_if_changed(self.profit_margin_var, _PCT(result.profit_margin_percentage))
+            self._set_if_changed(self.markup_percentage_var, _PCT(result.markup_percentage))
         
         # Update the chart
         self._create_price_breakdown_chart(result) 
\ No newline at end of file
@@ -3,14 +3,32 @@ Welcome screen for the Handmade Goods Pricing Assistant.
 Provides options to use the AI assistant or go directly to the calculator.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, font
+from pathlib import Path
+
+# Pre-rendered 24x24 option icons; loading these as PhotoImages avoids the
+# platform emoji-font fallback lookup Tk does when rendering 🤖/🧮 as text
+_ASSETS_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))) / "assets"
 
 class WelcomeScreen(ttk.Frame):
     """
     Welcome screen with options to use the AI assistant or go directly to the calculator.
     """
-    
+
+    # Named fonts shared across instances: each font.Font() call registers a
+    # named font with a Tk round-trip, so they are created once on first use
+    # (they need a live Tk root, hence not at import time)
+    _title_font = None
+    _subtitle_font = None
+
+    # Option icons shared across instances, loaded lazily like the fonts
+    # (PhotoImage also needs a live Tk root). False means loading failed
+    # and the emoji text fallback should be used instead
+    _robot_img = None
+    _abacus_img = None
+
     def __init__(self, parent, show_chat_callback, show_calculator_callback):
         """
         Initialize the welcome screen.
@@ -29,6 +47,22 @@ class WelcomeScreen(ttk.Frame):
     
     def _setup_ui(self):
         """Set up the welcome screen UI."""
+        if WelcomeScreen._title_font is None:
+            WelcomeScreen._title_font = font.Font(family="Arial", size=18, weight="bold")
+            WelcomeScreen._subtitle_font = font.Font(family="Arial", size=12)
+        title_font = WelcomeScreen._title_font
+        subtitle_font = WelcomeScreen._subtitle_font
+
+        if WelcomeScreen._robot_img is None:
+            try:
+                WelcomeScreen._robot_img = tk.PhotoImage(file=str(_ASSETS_DIR / "robot.png"))
+                WelcomeScreen._abacus_img = tk.PhotoImage(file=str(_ASSETS_DIR / "abacus.png"))
+            except tk.TclError:
+                # Assets missing or unreadable: remember the failure and
+                # fall back to the emoji labels
+                WelcomeScreen._robot_img = False
+                WelcomeScreen._abacus_img = False
+
         # Configure for responsive layout
         self.columnconfigure(0, weight=1)
         
@@ -41,7 +75,6 @@ class WelcomeScreen(ttk.Frame):
         logo_frame.pack(pady=20)
         
         # Title
-        title_font = font.Font(family="Arial", size=18, weight="bold")
         title = ttk.Label(
             logo_frame, 
             text="Handmade Goods Pricing Assistant",
@@ -50,7 +83,6 @@ class WelcomeScreen(ttk.Frame):
         title.pack(anchor="center")
         
         # Subtitle
-        subtitle_font = font.Font(family="Arial", size=12)
         subtitle = ttk.Label(
             logo_frame, 
             text="Helping artisans price their creations fairly and profitably",
@@ -74,7 +106,10 @@ class WelcomeScreen(ttk.Frame):
         ai_button_frame = ttk.Frame(options_frame, padding="5")
         ai_button_frame.pack(pady=10)
         
-        ai_icon = ttk.Label(ai_button_frame, text="🤖")  # Robot emoji as icon
+        if WelcomeScreen._robot_img:
+            ai_icon = ttk.Label(ai_button_frame, image=WelcomeScreen._robot_img)
+        else:
+            ai_icon = ttk.Label(ai_button_frame, text="🤖")  # Robot emoji as icon
         ai_icon.pack(side=tk.LEFT, padx=(0, 10))
         
         ai_button_content = ttk.Frame(ai_button_frame)
@@ -100,7 +135,10 @@ class WelcomeScreen(ttk.Frame):
         calc_button_frame = ttk.Frame(options_frame, padding="5")
         calc_button_frame.pack(pady=10)
         
-        calc_icon = ttk.Label(calc_button_frame, text="🧮")  # Abacus emoji as icon
+        if WelcomeScreen._abacus_img:
+            calc_icon = ttk.Label(calc_button_frame, image=WelcomeScreen._abacus_img)
+        else:
+            calc_icon = ttk.Label(calc_button_frame, text="🧮")  # Abacus emoji as icon
         calc_icon.pack(side=tk.LEFT, padx=(0, 10))
         
         calc_button_content = ttk.Frame(calc_button_frame)
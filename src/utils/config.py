@@ -2,9 +2,34 @@
 Configuration utilities for the Handmade Goods Pricing Assistant
 """
 
+import atexit
 import json
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    # Optional: C-implemented JSON codec; the settings file is small so the
+    # win is startup latency, not throughput
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Parse JSON bytes with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_bytes(obj) -> bytes:
+    """Serialize to indented JSON bytes (the settings file stays editable)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4).encode("utf-8")
 
 # Default configuration values
 DEFAULT_CONFIG = {
@@ -30,32 +55,108 @@ DEFAULT_CONFIG = {
     }
 }
 
+# DEFAULT_CONFIG never changes at runtime: snapshot its sections once at
+# import so every load's merge iterates a prebuilt tuple instead of
+# allocating fresh dict views
+_DEFAULT_SECTIONS = tuple(DEFAULT_CONFIG.items())
+
+
+def _default_config_copy():
+    """
+    Build a fresh two-level copy of the default configuration
+
+    A plain DEFAULT_CONFIG.copy() would share the section dicts, so a later
+    set() would silently mutate the defaults themselves.
+
+    Returns:
+        Dictionary with independent per-section dictionaries
+    """
+    return {section: dict(values) for section, values in _DEFAULT_SECTIONS}
+
+
 class Config:
     """Configuration manager for the application"""
-    
+
+    # Fixed attribute layout: no per-instance __dict__, and attribute reads
+    # in hot helpers like get() become offset loads instead of dict lookups.
+    # The parsed config lives in _config behind the config property
+    __slots__ = ('config_dir', 'config_file', '_config', '_dirty',
+                 '_flush_timer', '_in_batch', '_last_written_bytes',
+                 '_lock', '_initialized')
+
+    # Singleton cache keyed by resolved config directory: several modules
+    # construct Config independently, and without this each construction
+    # re-stats and re-parses the same settings file
+    _instances = {}
+
+    @staticmethod
+    def _resolve_dir(config_dir):
+        """Resolve the configuration directory to an absolute Path"""
+        if config_dir is None:
+            # Use the config directory relative to the project root
+            return Path(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))) / "config"
+        return Path(config_dir).resolve()
+
+    def __new__(cls, config_dir=None):
+        resolved = cls._resolve_dir(config_dir)
+        instance = cls._instances.get(resolved)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[resolved] = instance
+        return instance
+
     def __init__(self, config_dir=None):
         """
         Initialize the configuration manager
-        
+
         Args:
             config_dir: Directory to store configuration files (default: 'config')
         """
+        # Reused singleton: everything below already ran for this directory
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+
         # Set up the configuration directory
-        if config_dir is None:
-            # Use the config directory relative to the project root
-            self.config_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))) / "config"
-        else:
-            self.config_dir = Path(config_dir)
-        
+        self.config_dir = self._resolve_dir(config_dir)
+
         # Create the config directory if it doesn't exist
         self.config_dir.mkdir(exist_ok=True)
         
         # Configuration file path
         self.config_file = self.config_dir / "settings.json"
         
-        # Load configuration (or create default if it doesn't exist)
-        self.config = self._load_config()
-    
+        # Write coalescing: set() marks the config dirty and schedules a
+        # short debounced flush instead of rewriting the file per key, so a
+        # burst of N updates costs one serialization and one disk write
+        self._dirty = False
+        self._flush_timer = None
+        self._in_batch = False
+
+        # _flush runs on a timer thread, so mutation and serialization must
+        # not interleave: an unguarded set() during serialization could both
+        # crash the dump ("dictionary changed size during iteration") and
+        # lose the racing update after _dirty was already cleared
+        self._lock = threading.RLock()
+
+        # Serialized form of the last write (or load), used to skip the
+        # disk write entirely when a save would be byte-identical
+        self._last_written_bytes = None
+
+        # Make sure a pending debounced write still lands on interpreter exit
+        atexit.register(self._flush)
+
+        # The file is parsed lazily on first access (see the config
+        # property), so merely constructing a Config does no disk I/O
+        self._config = None
+
+    @property
+    def config(self):
+        """The parsed configuration, read from disk on first access"""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+
     def _load_config(self):
         """
         Load configuration from file or create default
@@ -65,18 +166,18 @@ class Config:
         """
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    
-                # Merge with defaults in case new settings were added
-                self._merge_with_defaults(config)
-                return config
-            except (json.JSONDecodeError, IOError):
+                # One read syscall for the whole file; bytes go straight to
+                # the parser without a buffered text reader in between,
+                # then one merge pass layers the file over the defaults in
+                # case new settings were added
+                return self._merge_with_defaults(
+                    _loads(self.config_file.read_bytes()))
+            except (ValueError, IOError):
                 # If there's an error loading, use defaults
-                return DEFAULT_CONFIG.copy()
+                return _default_config_copy()
         else:
             # Create a new config file with default values
-            config = DEFAULT_CONFIG.copy()
+            config = _default_config_copy()
             self._save_config(config)
             return config
     
@@ -88,26 +189,53 @@ class Config:
             config: Configuration dictionary to save
         """
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            data = _dumps_bytes(config)
+
+            # Skip the write when nothing actually changed (e.g. the UI
+            # re-submitting current values). Compare against the in-memory
+            # copy of the last write, falling back to the on-disk bytes the
+            # first time around
+            if self._last_written_bytes is None and self.config_file.exists():
+                self._last_written_bytes = self.config_file.read_bytes()
+            if data == self._last_written_bytes:
+                return
+
+            # Serialize fully in memory, write to a sibling tempfile, then
+            # atomically rename over the real file: a crash mid-write leaves
+            # the previous settings intact instead of a truncated JSON
+            tmp = self.config_file.with_suffix('.json.tmp')
+            with open(tmp, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.config_file)
+            self._last_written_bytes = data
         except IOError:
             # Just log the error for now
             print(f"Error: Could not save configuration to {self.config_file}")
     
-    def _merge_with_defaults(self, config):
+    def _merge_with_defaults(self, loaded):
         """
-        Ensure all default keys exist in the config
-        
+        Layer loaded values over the defaults in a single pass
+
+        Each section is built with one C-level dict merge instead of a
+        per-key membership probe, and the result is a fresh dictionary so
+        neither the defaults nor the parsed input are mutated.
+
         Args:
-            config: Configuration dictionary to update
-        """
-        for section, values in DEFAULT_CONFIG.items():
-            if section not in config:
-                config[section] = values
-            else:
-                for key, value in values.items():
-                    if key not in config[section]:
-                        config[section][key] = value
+            loaded: Configuration dictionary parsed from disk
+
+        Returns:
+            Merged configuration with every default key present and loaded
+            values taking precedence
+        """
+        merged = {section: {**defaults, **loaded.get(section, {})}
+                  for section, defaults in _DEFAULT_SECTIONS}
+        # Preserve sections the defaults don't know about
+        for section, values in loaded.items():
+            if section not in merged:
+                merged[section] = values
+        return merged
     
     def get(self, section, key, default=None):
         """
@@ -135,43 +263,98 @@ class Config:
             key: Configuration key
             value: Value to set
         """
-        # Ensure section exists
-        if section not in self.config:
-            self.config[section] = {}
-        
-        # Set the value
-        self.config[section][key] = value
-        
-        # Save the configuration
-        self._save_config(self.config)
-    
+        with self._lock:
+            # Ensure section exists
+            if section not in self.config:
+                self.config[section] = {}
+
+            # Set the value
+            self.config[section][key] = value
+            self._dirty = True
+
+            # Inside a batch the flush happens once on exit; otherwise
+            # schedule a debounced write so rapid consecutive sets coalesce
+            if not self._in_batch:
+                self._schedule_flush()
+
+    def _schedule_flush(self):
+        """(Re)start the debounce timer for the next disk write"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(0.2, self._flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _flush(self):
+        """Write the config to disk if there are unsaved changes"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._dirty = False
+                self._save_config(self.config)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several set() calls into a single disk write
+
+        Usage:
+            with config.batch():
+                config.set("ui", "theme", "dark")
+                config.set("ui", "decimal_places", 3)
+        """
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            self._flush()
+
+
     def get_pricing_settings(self):
         """
         Get all pricing-related settings
-        
+
         Returns:
-            Dictionary of pricing settings
+            Read-only view of the pricing settings (zero-copy; callers
+            needing a mutable copy should wrap it in dict())
         """
-        return self.config["pricing"].copy()
-    
+        return MappingProxyType(self.config["pricing"])
+
     def get_ui_settings(self):
         """
         Get all UI-related settings
-        
+
         Returns:
-            Dictionary of UI settings
+            Read-only view of the UI settings
         """
-        return self.config["ui"].copy()
-    
+        return MappingProxyType(self.config["ui"])
+
     def get_default_values(self):
         """
         Get default input values
-        
+
         Returns:
-            Dictionary of default values
+            Read-only view of the default values
         """
-        return self.config["defaults"].copy()
+        return MappingProxyType(self.config["defaults"])
     
+    def reload(self):
+        """Re-read the configuration from disk, discarding unsaved changes"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            self._config = self._load_config()
+
     def save(self):
-        """Save the current configuration to file"""
-        self._save_config(self.config) 
\ No newline at end of file
+        """Save the current configuration to file immediately"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            self._save_config(self.config)
\ No newline at end of file
@@ -2,6 +2,8 @@
 Validation utilities for the Handmade Goods Pricing Assistant
 """
 
+import numpy as np
+
 def validate_numeric_input(value, min_value=None, max_value=None, field_name="Value"):
     """
     Validate that a value is numeric and within the specified range
@@ -18,21 +20,52 @@ def validate_numeric_input(value, min_value=None, max_value=None, field_name="Va
     Raises:
         ValueError: If the value is not valid
     """
-    try:
-        # Try to convert to float
-        float_value = float(value)
-        
-        # Check bounds if provided
-        if min_value is not None and float_value < min_value:
-            raise ValueError(f"{field_name} must be at least {min_value}")
-            
-        if max_value is not None and float_value > max_value:
-            raise ValueError(f"{field_name} cannot exceed {max_value}")
-            
-        return float_value
-        
-    except (ValueError, TypeError):
-        raise ValueError(f"{field_name} must be a valid number")
+    ok, result = try_validate_numeric(value, min_value, max_value, field_name)
+    if not ok:
+        raise ValueError(result)
+    return result
+
+def try_validate_numeric(value, min_value=None, max_value=None, field_name="Value"):
+    """
+    Validate a numeric value, reporting failure without raising
+
+    Raising an exception allocates an exception object and traceback, which
+    is wasteful for callers that validate on every keystroke and expect
+    in-progress invalid values. This variant returns the outcome as a tuple
+    instead.
+
+    Args:
+        value: The value to validate
+        min_value: The minimum allowed value (optional)
+        max_value: The maximum allowed value (optional)
+        field_name: The name of the field for error messages
+
+    Returns:
+        (True, validated float) on success, (False, error message) on failure
+    """
+    # Fast path: already a float (the common case when validated values are
+    # round-tripped back in). The type check is a pointer compare vs. the
+    # full float() constructor dispatch; value == value rejects NaN, which
+    # float() would otherwise let through unbounded checks
+    if type(value) is float and value == value:
+        float_value = value
+    else:
+        try:
+            # Try to convert to float
+            float_value = float(value)
+        except (ValueError, TypeError):
+            return False, f"{field_name} must be a valid number"
+        if float_value != float_value:  # NaN compares unequal to itself
+            return False, f"{field_name} must be a valid number"
+
+    # Check bounds if provided
+    if min_value is not None and float_value < min_value:
+        return False, f"{field_name} must be at least {min_value}"
+
+    if max_value is not None and float_value > max_value:
+        return False, f"{field_name} cannot exceed {max_value}"
+
+    return True, float_value
 
 def validate_integer_input(value, min_value=None, max_value=None, field_name="Value"):
     """
@@ -50,23 +83,173 @@ def validate_integer_input(value, min_value=None, max_value=None, field_name="Va
     Raises:
         ValueError: If the value is not valid
     """
-    try:
-        # Try to convert to int
-        int_value = int(value)
-        
-        # Check bounds if provided
-        if min_value is not None and int_value < min_value:
-            raise ValueError(f"{field_name} must be at least {min_value}")
-            
-        if max_value is not None and int_value > max_value:
-            raise ValueError(f"{field_name} cannot exceed {max_value}")
-            
-        return int_value
-        
-    except (ValueError, TypeError):
-        raise ValueError(f"{field_name} must be a valid integer")
-
-def validate_pricing_inputs(material_cost, hours_worked, labor_rate, 
+    ok, result = try_validate_integer(value, min_value, max_value, field_name)
+    if not ok:
+        raise ValueError(result)
+    return result
+
+def try_validate_integer(value, min_value=None, max_value=None, field_name="Value"):
+    """
+    Validate an integer value, reporting failure without raising
+
+    Integer counterpart of try_validate_numeric; see there for why failure
+    is returned instead of raised.
+
+    Args:
+        value: The value to validate
+        min_value: The minimum allowed value (optional)
+        max_value: The maximum allowed value (optional)
+        field_name: The name of the field for error messages
+
+    Returns:
+        (True, validated int) on success, (False, error message) on failure
+    """
+    # Fast path: already an int. bool is excluded since it subclasses int
+    # and True/False are never valid ratings
+    if type(value) is int:
+        int_value = value
+    else:
+        try:
+            # Try to convert to int
+            int_value = int(value)
+        except (ValueError, TypeError):
+            return False, f"{field_name} must be a valid integer"
+
+    # Check bounds if provided
+    if min_value is not None and int_value < min_value:
+        return False, f"{field_name} must be at least {min_value}"
+
+    if max_value is not None and int_value > max_value:
+        return False, f"{field_name} cannot exceed {max_value}"
+
+    return True, int_value
+
+def make_numeric_validator(min_value=None, max_value=None, field_name="Value"):
+    """
+    Build a specialized numeric validator with the bounds baked in
+
+    The returned closure contains only the comparisons its bounds need and
+    has the error strings pre-formatted, so a hot call site (the calculator
+    re-validates the same fields on every recalculation) skips the
+    is-None branches and f-string formatting that validate_numeric_input
+    pays per call.
+
+    Args:
+        min_value: The minimum allowed value (optional)
+        max_value: The maximum allowed value (optional)
+        field_name: The name of the field for error messages
+
+    Returns:
+        A function taking a value and returning it validated as a float
+    """
+    type_error = f"{field_name} must be a valid number"
+    min_error = f"{field_name} must be at least {min_value}"
+    max_error = f"{field_name} cannot exceed {max_value}"
+
+    def to_float(value):
+        # Shared conversion with the already-a-float fast path
+        if type(value) is float and value == value:
+            return value
+        try:
+            float_value = float(value)
+        except (ValueError, TypeError):
+            raise ValueError(type_error)
+        if float_value != float_value:  # NaN compares unequal to itself
+            raise ValueError(type_error)
+        return float_value
+
+    if min_value is not None and max_value is not None:
+        def validator(value):
+            float_value = to_float(value)
+            if float_value < min_value:
+                raise ValueError(min_error)
+            if float_value > max_value:
+                raise ValueError(max_error)
+            return float_value
+    elif min_value is not None:
+        def validator(value):
+            float_value = to_float(value)
+            if float_value < min_value:
+                raise ValueError(min_error)
+            return float_value
+    elif max_value is not None:
+        def validator(value):
+            float_value = to_float(value)
+            if float_value > max_value:
+                raise ValueError(max_error)
+            return float_value
+    else:
+        validator = to_float
+    return validator
+
+def make_integer_validator(min_value=None, max_value=None, field_name="Value"):
+    """
+    Build a specialized integer validator with the bounds baked in
+
+    Integer counterpart of make_numeric_validator; see there for why the
+    bounds branches and error strings are resolved at factory time.
+
+    Args:
+        min_value: The minimum allowed value (optional)
+        max_value: The maximum allowed value (optional)
+        field_name: The name of the field for error messages
+
+    Returns:
+        A function taking a value and returning it validated as an int
+    """
+    type_error = f"{field_name} must be a valid integer"
+    min_error = f"{field_name} must be at least {min_value}"
+    max_error = f"{field_name} cannot exceed {max_value}"
+
+    def to_int(value):
+        # Shared conversion with the already-an-int fast path (bool is
+        # excluded since it subclasses int)
+        if type(value) is int:
+            return value
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            raise ValueError(type_error)
+
+    if min_value is not None and max_value is not None:
+        def validator(value):
+            int_value = to_int(value)
+            if int_value < min_value:
+                raise ValueError(min_error)
+            if int_value > max_value:
+                raise ValueError(max_error)
+            return int_value
+    elif min_value is not None:
+        def validator(value):
+            int_value = to_int(value)
+            if int_value < min_value:
+                raise ValueError(min_error)
+            return int_value
+    elif max_value is not None:
+        def validator(value):
+            int_value = to_int(value)
+            if int_value > max_value:
+                raise ValueError(max_error)
+            return int_value
+    else:
+        validator = to_int
+    return validator
+
+# Validation spec for validate_pricing_inputs, one row per required field:
+# (key, pre-built validator). The closures are specialized once at import,
+# so each field costs one minimal call instead of re-resolving bounds and
+# formatting error strings per validation
+_PRICING_SPEC = (
+    ("material_cost", make_numeric_validator(0, None, "Material cost")),
+    ("hours_worked", make_numeric_validator(0, None, "Hours worked")),
+    ("labor_rate", make_numeric_validator(0, None, "Labor rate")),
+    ("uniqueness", make_integer_validator(1, 10, "Uniqueness rating")),
+    ("demand", make_integer_validator(1, 10, "Demand rating")),
+)
+
+_VALIDATE_SELLING_PRICE = make_numeric_validator(0, None, "Selling price")
+
+def validate_pricing_inputs(material_cost, hours_worked, labor_rate,
                           uniqueness, demand, selling_price=None):
     """
     Validate all pricing inputs at once
@@ -85,39 +268,91 @@ def validate_pricing_inputs(material_cost, hours_worked, labor_rate,
     Raises:
         ValueError: If any input is invalid
     """
-    # Validate each input
-    validated_material_cost = validate_numeric_input(
-        material_cost, min_value=0, field_name="Material cost")
-    
-    validated_hours_worked = validate_numeric_input(
-        hours_worked, min_value=0, field_name="Hours worked")
-    
-    validated_labor_rate = validate_numeric_input(
-        labor_rate, min_value=0, field_name="Labor rate")
-    
-    validated_uniqueness = validate_integer_input(
-        uniqueness, min_value=1, max_value=10, field_name="Uniqueness rating")
-    
-    validated_demand = validate_integer_input(
-        demand, min_value=1, max_value=10, field_name="Demand rating")
-    
-    # Selling price is optional but must be non-negative if provided
-    validated_selling_price = None
+    # Validate all required fields in one pass over the spec table of
+    # pre-built validators
+    values = (material_cost, hours_worked, labor_rate, uniqueness, demand)
+    result = {}
+    for (key, validate), value in zip(_PRICING_SPEC, values):
+        result[key] = validate(value)
+
+    # Selling price is optional but must be non-negative if provided;
+    # only include it when provided and positive
     if selling_price is not None:
-        validated_selling_price = validate_numeric_input(
-            selling_price, min_value=0, field_name="Selling price")
-    
-    # Return all validated values
-    result = {
-        "material_cost": validated_material_cost,
-        "hours_worked": validated_hours_worked,
-        "labor_rate": validated_labor_rate,
-        "uniqueness": validated_uniqueness,
-        "demand": validated_demand
-    }
-    
-    # Only include selling_price if it's provided and valid
-    if validated_selling_price is not None and validated_selling_price > 0:
-        result["selling_price"] = validated_selling_price
-        
-    return result 
\ No newline at end of file
+        validated_selling_price = _VALIDATE_SELLING_PRICE(selling_price)
+        if validated_selling_price > 0:
+            result["selling_price"] = validated_selling_price
+
+    return result
+
+def validate_pricing_inputs_batch(material_cost, hours_worked, labor_rate,
+                                  uniqueness, demand, selling_price=None):
+    """
+    Validate pricing inputs for many products at once
+
+    Vectorized counterpart of validate_pricing_inputs for array inputs
+    (e.g. a spreadsheet import): each column is converted and bounds-checked
+    with NumPy masks, so a batch of N products costs a handful of C-loop
+    comparisons instead of 6N Python-level checks. Pairs with
+    PricingCalculator.calculate_prices_batch, which takes the same columns.
+
+    Args:
+        material_cost: Array of material costs in dollars
+        hours_worked: Array of hours spent creating each product
+        labor_rate: Array of hourly labor rates in dollars
+        uniqueness: Array of uniqueness ratings (1-10)
+        demand: Array of demand ratings (1-10)
+        selling_price: Optional array of user-set selling prices
+                       (0 means calculate automatically)
+
+    Returns:
+        Dictionary with one validated array per field
+
+    Raises:
+        ValueError: If any entry is invalid, naming the field and the first
+                    offending row
+    """
+    result = {}
+
+    float_columns = (("material_cost", "Material cost", material_cost),
+                     ("hours_worked", "Hours worked", hours_worked),
+                     ("labor_rate", "Labor rate", labor_rate))
+    for key, label, column in float_columns:
+        try:
+            values = np.asarray(column, dtype=np.float64)
+        except (ValueError, TypeError):
+            raise ValueError(f"{label} must be valid numbers")
+        if np.isnan(values).any():
+            raise ValueError(f"{label} must be valid numbers")
+        invalid = values < 0
+        if invalid.any():
+            raise ValueError(
+                f"{label} must be at least 0 (row {int(np.argmax(invalid))})")
+        result[key] = values
+
+    rating_columns = (("uniqueness", "Uniqueness rating", uniqueness),
+                      ("demand", "Demand rating", demand))
+    for key, label, column in rating_columns:
+        try:
+            values = np.asarray(column, dtype=np.int64)
+        except (ValueError, TypeError):
+            raise ValueError(f"{label} must be valid integers")
+        invalid = (values < 1) | (values > 10)
+        if invalid.any():
+            raise ValueError(
+                f"{label} must be between 1 and 10 (row {int(np.argmax(invalid))})")
+        result[key] = values
+
+    if selling_price is not None:
+        try:
+            values = np.asarray(selling_price, dtype=np.float64)
+        except (ValueError, TypeError):
+            raise ValueError("Selling price must be valid numbers")
+        if np.isnan(values).any():
+            raise ValueError("Selling price must be valid numbers")
+        invalid = values < 0
+        if invalid.any():
+            raise ValueError(
+                f"Selling price must be at least 0 (row {int(np.argmax(invalid))})")
+        result["selling_price"] = values
+
+    return result
\ No newline at end of file